@@ -0,0 +1,205 @@
+# assets.py
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+
+import click
+from flask import abort, current_app, request, send_from_directory
+from flask.cli import AppGroup
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:  # Optional: without it only gzip variants are written
+    brotli = None
+
+ONE_YEAR = 365 * 24 * 60 * 60
+
+# Content-Encoding -> file suffix of the precompressed variant, best first
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+COMPRESSIBLE_EXTENSIONS = {'.css', '.js', '.svg', '.html', '.json', '.txt', '.xml', '.map'}
+
+# css/styles.0123456789abcdef.css -> ('css/styles', '0123456789abcdef', '.css')
+_HASHED_NAME = re.compile(r'^(.+)\.([0-9a-f]{16})(\.[^./]+)$')
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(64 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+class StaticAssets:
+    """Fingerprinted static files with far-future caching.
+
+    ``url_for('static', filename=...)`` emits names carrying a hash of the
+    file content, e.g. ``css/styles.<hash>.css``. Requests for the current
+    hash are served as immutable for a year; anything else (plain names,
+    outdated hashes) must be revalidated. Every response has a strong ETag
+    derived from the content, so revalidation is a 304.
+
+    Files with precompressed ``.br``/``.gz`` siblings (written by ``flask
+    assets compress``) are served in the best encoding the client accepts,
+    with ``Vary: Accept-Encoding``.
+
+    Digests and available variants are looked up on first use and kept for
+    the life of the process, or rechecked against the file's mtime when the
+    app runs in debug mode.
+    """
+
+    def __init__(self, app=None):
+        self._digests = {}  # path -> (mtime_ns, size, digest, encodings)
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('STATIC_MAX_AGE', ONE_YEAR)
+        app.url_defaults(self._fingerprint_url)
+        app.view_functions['static'] = self.send_static
+        app.extensions['static_assets'] = self
+        app.cli.add_command(assets_cli)
+
+    def _entry(self, filename):
+        path = safe_join(current_app.static_folder, filename)
+        cached = self._digests.get(path)
+        if cached is not None and not current_app.debug:
+            return cached
+        try:
+            stat = os.stat(path) if path else None
+        except OSError:
+            stat = None
+        if stat is None or not os.path.isfile(path):
+            return None
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached
+        entry = (stat.st_mtime_ns, stat.st_size, file_digest(path), _fresh_encodings(path, stat))
+        with self._lock:
+            self._digests[path] = entry
+        return entry
+
+    def digest(self, filename):
+        """Return the content hash of a static file, or None if it does not exist."""
+        entry = self._entry(filename)
+        return entry[2] if entry is not None else None
+
+    def hashed_name(self, filename):
+        digest = self.digest(filename)
+        if digest is None:
+            return filename
+        root, ext = os.path.splitext(filename)
+        return f'{root}.{digest}{ext}'
+
+    def resolve(self, filename):
+        """Split a requested name into (file name, requested hash or None)."""
+        match = _HASHED_NAME.match(filename)
+        if match is None:
+            return filename, None
+        original = match.group(1) + match.group(3)
+        if self.digest(original) is None:
+            return filename, None
+        return original, match.group(2)
+
+    def _fingerprint_url(self, endpoint, values):
+        if endpoint == 'static' and 'filename' in values:
+            values['filename'] = self.hashed_name(values['filename'])
+
+    def send_static(self, filename):
+        filename, requested = self.resolve(filename)
+        entry = self._entry(filename)
+        if entry is None:
+            abort(404)
+        digest, encodings = entry[2], entry[3]
+        immutable = requested == digest
+        encoding = _negotiate(encodings)
+        if encoding is None:
+            response = send_from_directory(
+                current_app.static_folder, filename, etag=digest,
+                max_age=current_app.config['STATIC_MAX_AGE'] if immutable else 0,
+            )
+        else:
+            # Each encoding is a separate representation with its own ETag
+            response = send_from_directory(
+                current_app.static_folder, filename + dict(ENCODINGS)[encoding],
+                mimetype=mimetypes.guess_type(filename)[0] or 'application/octet-stream',
+                etag=f'{digest}-{encoding}',
+                max_age=current_app.config['STATIC_MAX_AGE'] if immutable else 0,
+            )
+            response.content_encoding = encoding
+        if encodings:
+            response.vary.add('Accept-Encoding')
+        if immutable:
+            response.cache_control.public = True
+            response.cache_control.immutable = True
+        else:
+            response.cache_control.no_cache = True
+        return response
+
+
+def _fresh_encodings(path, stat):
+    # Encodings with a variant that is at least as new as the original file
+    encodings = []
+    for encoding, suffix in ENCODINGS:
+        try:
+            if os.stat(path + suffix).st_mtime_ns >= stat.st_mtime_ns:
+                encodings.append(encoding)
+        except OSError:
+            pass
+    return tuple(encodings)
+
+
+def _negotiate(encodings):
+    """Pick the best available encoding the client accepts, or None for identity."""
+    best, best_quality = None, 0
+    for encoding in encodings:
+        quality = request.accept_encodings[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress_file(path):
+    """Write .gz and .br siblings of ``path``; returns the variants written.
+
+    A variant is only kept if it is smaller than the original.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    compressors = {'gzip': lambda raw: gzip.compress(raw, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        compressors['br'] = lambda raw: brotli.compress(raw, quality=11)
+    written = []
+    for encoding, suffix in ENCODINGS:
+        if encoding not in compressors:
+            continue
+        compressed = compressors[encoding](data)
+        if len(compressed) < len(data):
+            with open(path + suffix, 'wb') as f:
+                f.write(compressed)
+            written.append((path + suffix, len(data), len(compressed)))
+        elif os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    return written
+
+
+assets_cli = AppGroup('assets', help='Build static asset variants.')
+
+
+@assets_cli.command('compress')
+def compress_command():
+    """Write precompressed .gz/.br variants of compressible static files."""
+    if brotli is None:
+        click.echo('brotli is not installed; writing gzip variants only.')
+    root = current_app.static_folder
+    for directory, _, files in os.walk(root):
+        for name in sorted(files):
+            if os.path.splitext(name)[1] not in COMPRESSIBLE_EXTENSIONS:
+                continue
+            for variant, original_size, size in compress_file(os.path.join(directory, name)):
+                click.echo(f'{os.path.relpath(variant, root)}: {original_size} -> {size} bytes')
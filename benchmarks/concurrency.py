@@ -0,0 +1,108 @@
+# benchmarks/concurrency.py
+"""Run catalog reads alongside cart writes under each SQLite storage profile.
+
+Usage: python benchmarks/concurrency.py [--readers N] [--seconds S] [--profile NAME ...]
+
+Each profile runs against its own copy of instance/books.db. Reader threads
+load category pages while one writer thread keeps upserting cart lines and
+committing, as add_to_cart does. Reported are read throughput and latency
+percentiles, which show how long readers wait behind commits, and the
+write rate.
+"""
+import argparse
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+
+from storage import PROFILES, set_pragmas  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATABASE = os.path.join(ROOT, 'instance', 'books.db')
+
+READ = text('SELECT id, title, author, price_cents, summary, image FROM product '
+            'WHERE category_id = :category_id ORDER BY id LIMIT 13')
+WRITE = text('INSERT INTO cart (token, product_id, quantity) VALUES (:token, :product_id, 1) '
+             'ON CONFLICT (token, product_id) DO UPDATE SET quantity = quantity + 1')
+
+
+def run(profile, readers, seconds):
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'books.db')
+    shutil.copy(DATABASE, path)
+    engine = create_engine(f'sqlite:///{path}', **PROFILES[profile]['engine_options'])
+    set_pragmas(engine, PROFILES[profile]['pragmas'])
+    with engine.connect() as connection:
+        product_ids = [row[0] for row in connection.execute(text('SELECT id FROM product'))]
+        category_ids = [row[0] for row in connection.execute(text('SELECT id FROM category'))]
+
+    stop = threading.Event()
+    latencies, writes, errors = [], [0], [0]
+    lock = threading.Lock()
+
+    def reader():
+        timings = []
+        while not stop.is_set():
+            start = time.perf_counter()
+            try:
+                with engine.connect() as connection:
+                    connection.execute(READ, {'category_id': random.choice(category_ids)}).all()
+            except OperationalError:
+                with lock:
+                    errors[0] += 1
+                continue
+            timings.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(timings)
+
+    def writer():
+        while not stop.is_set():
+            try:
+                with engine.begin() as connection:
+                    connection.execute(WRITE, {'token': f'bench-{random.randrange(1000)}',
+                                               'product_id': random.choice(product_ids)})
+            except OperationalError:
+                with lock:
+                    errors[0] += 1
+                continue
+            writes[0] += 1
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+    shutil.rmtree(directory)
+
+    latencies.sort()
+    ms = [latency * 1000 for latency in latencies]
+    print(f'{profile:10} {len(ms) / seconds:8.0f} reads/s  '
+          f'p50 {statistics.median(ms):6.2f} ms  p99 {ms[int(len(ms) * 0.99)]:7.2f} ms  '
+          f'max {ms[-1]:7.2f} ms  {writes[0] / seconds:6.0f} writes/s  {errors[0]} errors')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--profile', action='append', choices=sorted(PROFILES))
+    args = parser.parse_args()
+    for profile in args.profile or sorted(PROFILES):
+        run(profile, args.readers, args.seconds)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/list_pages.py
+"""Compare loading list-page rows as ORM Products and as ProductCards.
+
+Usage: python benchmarks/list_pages.py [--rows N] [--runs N]
+
+Both loaders read the first N products of the app's database. Latency is the
+median over the runs, each in a fresh session so the ORM pays for building
+its identity map as it would in a request. Memory is measured with
+tracemalloc: peak while loading, and what the loaded rows keep alive. Load a
+larger catalog with populate_db.py to see how this scales.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select  # noqa: E402
+
+from app import create_app  # noqa: E402
+from extensions import db  # noqa: E402
+from models import Product  # noqa: E402
+from catalog import card_columns, load_cards  # noqa: E402
+
+
+def load_orm(rows):
+    return Product.query.order_by(Product.id).limit(rows).all()
+
+
+def load_dto(rows):
+    return load_cards(db.session, select(*card_columns(Product)).order_by(Product.id).limit(rows))
+
+
+def measure(loader, rows, runs):
+    """Return (median ms, peak KiB, retained KiB, row count) for ``loader``."""
+    timings = []
+    for _ in range(runs):
+        db.session.remove()
+        start = time.perf_counter()
+        loader(rows)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    db.session.remove()
+    loader(rows)  # Warm statement caches before tracing
+    db.session.remove()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = loader(rows)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), (peak - before) / 1024, (current - before) / 1024, len(result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=500)
+    parser.add_argument('--runs', type=int, default=50)
+    args = parser.parse_args()
+
+    with create_app().app_context():
+        for name, loader in (('Product.query', load_orm), ('ProductCard', load_dto)):
+            median, peak, retained, count = measure(loader, args.rows, args.runs)
+            print(f'{name:14} {count} rows: {median:7.2f} ms median, '
+                  f'{peak:8.1f} KiB peak, {retained:8.1f} KiB retained')
+
+
+if __name__ == '__main__':
+    main()
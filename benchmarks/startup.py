@@ -0,0 +1,60 @@
+# benchmarks/startup.py
+"""Measure how long a fresh interpreter takes to import the app.
+
+Usage: python benchmarks/startup.py [--runs N] [--budget-ms MS] [--module run]
+
+The default module, run, calls create_app() and so covers everything a worker
+does before serving; --module app times the factory module on its own. The
+framework packages are timed on their own as well, and the budget applies to
+what the app adds on top of them. Exits with status 1 if the median app
+overhead is over the budget.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FRAMEWORK_MODULES = 'flask, flask_sqlalchemy, flask_wtf, wtforms'
+
+IMPORT_TIMER = (
+    'import time\n'
+    'start = time.perf_counter()\n'
+    'import {modules}\n'
+    'print(time.perf_counter() - start)\n'
+)
+
+
+def measure(modules, runs):
+    """Return the median time in ms to import ``modules`` in a new interpreter."""
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', IMPORT_TIMER.format(modules=modules)],
+            cwd=ROOT, check=True, capture_output=True, text=True,
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--budget-ms', type=float, default=100.0)
+    parser.add_argument('--module', default='run')
+    args = parser.parse_args()
+
+    frameworks = measure(FRAMEWORK_MODULES, args.runs)
+    total = measure(args.module, args.runs)
+    overhead = total - frameworks
+    print(f'import {args.module}: {total:.1f} ms median over {args.runs} runs '
+          f'({frameworks:.1f} ms frameworks, {overhead:.1f} ms app)')
+    if overhead > args.budget_ms:
+        print(f'app import is over the {args.budget_ms:.0f} ms startup budget')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,252 @@
+# cart_store.py
+import itertools
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from sqlalchemy import func, literal, select
+from sqlalchemy.dialects.sqlite import insert
+
+from catalog import ProductCard, card_columns, load_cards
+
+# Cart line as returned by both stores; ``product`` is a ProductCard
+CartLine = namedtuple('CartLine', ['id', 'product', 'quantity', 'line_total_cents'])
+
+# A cart's lines and its subtotal in cents per currency
+Basket = namedtuple('Basket', ['lines', 'totals'])
+EMPTY_BASKET = Basket([], {})
+
+# Largest quantity of one product in a cart, as the add-to-basket form allows;
+# adding more to a full line leaves it at this
+MAX_QUANTITY = 99
+
+# Order columns filled from the checkout form
+CUSTOMER_FIELDS = ('customer_name', 'customer_address', 'customer_email')
+
+
+def _key_used(order_model, checkout_key):
+    # A key with orders belongs to a completed checkout, so a resubmitted or
+    # stale checkout form creates nothing and leaves the cart alone
+    order = order_model.__table__
+    return select(order.c.id).where(order.c.checkout_key == checkout_key).exists()
+
+
+class SQLCartStore:
+    """Cart lines kept in the Cart table, keyed by an indexed cart token.
+
+    Safe to share between worker processes.
+    """
+
+    def __init__(self, db, product_model, cart_model, order_model):
+        self.db = db
+        self.product_model = product_model
+        self.cart_model = cart_model
+        self.order_model = order_model
+
+    def basket(self, token):
+        """Return the cart's lines with line totals and subtotals, in one query."""
+        Cart, Product = self.cart_model, self.product_model
+        line_total = Cart.quantity * Product.price_cents
+        rows = self.db.session.execute(
+            select(Cart.id, Cart.quantity, line_total,
+                   func.sum(line_total).over(partition_by=Product.currency),
+                   *card_columns(Product))
+            .join(Product, Product.id == Cart.product_id)
+            .where(Cart.token == token)
+            .order_by(Cart.id))
+        lines, totals = [], {}
+        for line_id, quantity, line_total_cents, subtotal_cents, *card in rows:
+            product = ProductCard._make(card)
+            lines.append(CartLine(line_id, product, quantity, line_total_cents))
+            totals[product.currency] = subtotal_cents
+        return Basket(lines, totals)
+
+    def add(self, token, product_id, quantity):
+        self.add_many(token, [(product_id, quantity)])
+
+    def add_many(self, token, items):
+        """Add (product_id, quantity) pairs in one transaction.
+
+        Each product has at most one line per cart: adding a product that is
+        already in the cart increases the quantity of its line, up to
+        MAX_QUANTITY.
+        """
+        Cart = self.cart_model
+        statement = insert(Cart.__table__)
+        statement = statement.on_conflict_do_update(
+            index_elements=['token', 'product_id'],
+            set_={'quantity': func.min(Cart.__table__.c.quantity + statement.excluded.quantity,
+                                       MAX_QUANTITY)},
+        )
+        self.db.session.execute(statement, [
+            {'token': token, 'product_id': product_id, 'quantity': min(quantity, MAX_QUANTITY)}
+            for product_id, quantity in _merge_items(items)
+        ])
+        self.db.session.commit()
+
+    def remove(self, token, line_id):
+        """Remove one line from the cart; returns False if the cart has no such line."""
+        Cart = self.cart_model
+        deleted = Cart.query.filter(Cart.id == line_id, Cart.token == token).delete()
+        self.db.session.commit()
+        return deleted > 0
+
+    def clear(self, token):
+        Cart = self.cart_model
+        Cart.query.filter(Cart.token == token).delete()
+        self.db.session.commit()
+
+    def checkout(self, token, checkout_key, customer):
+        """Turn the cart into Order rows and empty it, in one transaction.
+
+        The orders are written with a single INSERT .. SELECT from the cart
+        lines, which inserts nothing if ``checkout_key`` was already used.
+        Returns the number of order lines created.
+        """
+        cart = self.cart_model.__table__
+        lines = select(
+            cart.c.product_id, cart.c.quantity, literal(checkout_key),
+            *(literal(customer[field]) for field in CUSTOMER_FIELDS)
+        ).where(cart.c.token == token, ~_key_used(self.order_model, checkout_key))
+        statement = insert(self.order_model.__table__).from_select(
+            ['product_id', 'quantity', 'checkout_key', *CUSTOMER_FIELDS], lines)
+        try:
+            created = self.db.session.execute(statement).rowcount
+            if created:
+                self.db.session.execute(cart.delete().where(cart.c.token == token))
+            self.db.session.commit()
+        except Exception:
+            self.db.session.rollback()
+            raise
+        return created
+
+
+class MemoryCartStore:
+    """Cart lines kept in a dict in this process, expiring after ``ttl`` seconds idle.
+
+    Only suitable for a single worker process.
+    """
+
+    def __init__(self, db, product_model, order_model, ttl=24 * 60 * 60, clock=time.monotonic):
+        self.db = db
+        self.product_model = product_model
+        self.order_model = order_model
+        self.ttl = ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._carts = {}  # token -> [expires_at, OrderedDict(product_id -> [line_id, quantity])]
+        self._line_ids = itertools.count(1)
+        self._next_purge = clock() + ttl
+
+    def _cart(self, token, create=False):
+        now = self.clock()
+        if now >= self._next_purge:
+            self._purge(now)
+        entry = self._carts.get(token)
+        if entry is not None and entry[0] <= now:
+            del self._carts[token]
+            entry = None
+        if entry is None:
+            if not create:
+                return None
+            entry = self._carts[token] = [0, OrderedDict()]
+        entry[0] = now + self.ttl
+        return entry[1]
+
+    def _purge(self, now):
+        for token in [token for token, entry in self._carts.items() if entry[0] <= now]:
+            del self._carts[token]
+        self._next_purge = now + self.ttl
+
+    def basket(self, token):
+        with self._lock:
+            cart = self._cart(token)
+            items = [(line_id, product_id, quantity)
+                     for product_id, (line_id, quantity) in (cart or {}).items()]
+        if not items:
+            return EMPTY_BASKET
+        Product = self.product_model
+        products = {product.id: product for product in load_cards(
+            self.db.session,
+            select(*card_columns(Product)).where(Product.id.in_({item[1] for item in items})))}
+        lines, totals = [], {}
+        for line_id, product_id, quantity in items:
+            product = products.get(product_id)
+            if product is None:
+                continue
+            lines.append(CartLine(line_id, product, quantity, quantity * product.price_cents))
+            totals[product.currency] = totals.get(product.currency, 0) + lines[-1].line_total_cents
+        return Basket(lines, totals)
+
+    def add(self, token, product_id, quantity):
+        self.add_many(token, [(product_id, quantity)])
+
+    def add_many(self, token, items):
+        """Add (product_id, quantity) pairs, merging them into existing lines."""
+        with self._lock:
+            cart = self._cart(token, create=True)
+            for product_id, quantity in _merge_items(items):
+                if product_id in cart:
+                    cart[product_id][1] = min(cart[product_id][1] + quantity, MAX_QUANTITY)
+                else:
+                    cart[product_id] = [next(self._line_ids), min(quantity, MAX_QUANTITY)]
+
+    def remove(self, token, line_id):
+        """Remove one line from the cart; returns False if the cart has no such line."""
+        with self._lock:
+            cart = self._cart(token)
+            for product_id, (cart_line_id, _) in (cart or {}).items():
+                if cart_line_id == line_id:
+                    del cart[product_id]
+                    return True
+            return False
+
+    def clear(self, token):
+        with self._lock:
+            self._carts.pop(token, None)
+
+    def checkout(self, token, checkout_key, customer):
+        """Write the cart as Order rows in one executemany and empty it.
+
+        Does nothing if ``checkout_key`` was already used. Returns the number
+        of order lines created.
+        """
+        with self._lock:
+            cart = self._cart(token)
+            items = [(product_id, quantity) for product_id, (_, quantity) in (cart or {}).items()]
+        if not items:
+            return 0
+        rows = [dict({'product_id': product_id, 'quantity': quantity, 'checkout_key': checkout_key},
+                     **{field: customer[field] for field in CUSTOMER_FIELDS})
+                for product_id, quantity in items]
+        try:
+            # Checked in the same transaction as the insert
+            if self.db.session.execute(select(_key_used(self.order_model, checkout_key))).scalar():
+                self.db.session.rollback()
+                return 0
+            created = self.db.session.execute(insert(self.order_model.__table__), rows).rowcount
+            self.db.session.commit()
+        except Exception:
+            self.db.session.rollback()
+            raise
+        self.clear(token)
+        return created
+
+
+def _merge_items(items):
+    # Collapse repeated products so each is written once
+    merged = OrderedDict()
+    for product_id, quantity in items:
+        merged[product_id] = merged.get(product_id, 0) + quantity
+    return merged.items()
+
+
+def create_cart_store(config, db, product_model, cart_model, order_model):
+    """Build the cart store selected by the CART_STORE config value."""
+    backend = config.get('CART_STORE', 'sql')
+    if backend == 'sql':
+        return SQLCartStore(db, product_model, cart_model, order_model)
+    if backend == 'memory':
+        return MemoryCartStore(db, product_model, order_model,
+                               ttl=config.get('CART_TTL', 24 * 60 * 60))
+    raise ValueError(f'unknown CART_STORE: {backend}')
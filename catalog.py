@@ -0,0 +1,298 @@
+# catalog.py
+import base64
+import json
+import math
+import time
+from collections import OrderedDict, namedtuple
+from datetime import datetime
+
+from sqlalchemy import DDL, DateTime, and_, event, or_, select, text, tuple_
+
+# Sort keys available for listings: name -> descending?
+# Every key is paired with the primary key so the ordering is total, and each
+# has a matching (category_id, <key>, id) index on Product.
+SORT_KEYS = {
+    'id': True,  # Newest additions first
+    'published_on': True,
+    'rating': True,
+}
+
+CatalogPage = namedtuple('CatalogPage', ['items', 'next_cursor'])
+
+CATEGORY_FIELDS = ('id', 'name', 'slug', 'position', 'image', 'product_count')
+CategoryRow = namedtuple('CategoryRow', CATEGORY_FIELDS)
+
+# Length of the stored summary shown on product cards
+SUMMARY_LENGTH = 100
+
+# Product columns list pages render, plus the keyset sort keys
+CARD_FIELDS = ('id', 'title', 'author', 'price_cents', 'currency', 'summary', 'image',
+               'category_id', 'published_on', 'rating', 'updated_at')
+
+
+class ProductCard(namedtuple('ProductCard', CARD_FIELDS)):
+    """Read-only product row for list pages.
+
+    Has the attributes templates use on Product, but is built straight from
+    a Core result row: no identity map, change tracking or unloaded columns.
+    """
+
+    __slots__ = ()
+
+
+def card_columns(model):
+    return [getattr(model, field) for field in CARD_FIELDS]
+
+
+def load_cards(session, statement):
+    """Execute a select of ``card_columns`` and return ProductCards."""
+    return [ProductCard._make(row) for row in session.execute(statement)]
+
+
+def category_slug(category):
+    return category.lower().replace(' ', '-')
+
+
+def summarize(text, length=SUMMARY_LENGTH):
+    """Shorten ``text`` at a word boundary, like Jinja's ``truncate`` filter."""
+    text = ' '.join(text.split())
+    if len(text) <= length:
+        return text
+    return text[:length - 3].rsplit(' ', 1)[0] + '...'
+
+
+def encode_cursor(value, last_id):
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([value, last_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor, column):
+    """Decode a cursor made by encode_cursor; raises ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        value, last_id = json.loads(raw)
+    except (TypeError, ValueError) as exc:
+        raise ValueError('invalid cursor') from exc
+    if not isinstance(last_id, int) or not _is_bindable_number(last_id):
+        raise ValueError('invalid cursor')
+    if value is None:
+        return value, last_id
+    if isinstance(column.type, DateTime):
+        if not isinstance(value, str):
+            raise ValueError('invalid cursor')
+        value = datetime.fromisoformat(value)
+    elif not _is_bindable_number(value):
+        raise ValueError('invalid cursor')
+    return value, last_id
+
+
+def _is_bindable_number(value):
+    # What SQLite can compare a numeric sort key with: a finite float or a
+    # 64-bit integer; JSON true and false are ints in Python
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return False
+    if isinstance(value, int):
+        return -2 ** 63 <= value < 2 ** 63
+    return math.isfinite(value)
+
+
+def _seek(column, id_column, value, last_id, descending):
+    # SQLite sorts NULLs first ascending and last descending; descending
+    # nullable keys are split into two ranges by CatalogView.page
+    if column is id_column:
+        return id_column < last_id if descending else id_column > last_id
+    if value is None:
+        return or_(column.isnot(None), and_(column.is_(None), id_column > last_id))
+    if descending:
+        return tuple_(column, id_column) < tuple_(value, last_id)
+    return tuple_(column, id_column) > tuple_(value, last_id)
+
+
+def count_trigger_statements(product, category):
+    """SQL keeping ``category.product_count`` in step with the ``product`` table."""
+    increment = f'UPDATE {category} SET product_count = product_count + 1 WHERE id = new.category_id;'
+    decrement = f'UPDATE {category} SET product_count = product_count - 1 WHERE id = old.category_id;'
+    return [
+        f'CREATE TRIGGER IF NOT EXISTS {product}_count_ai AFTER INSERT ON {product} '
+        f'BEGIN {increment} END',
+        f'CREATE TRIGGER IF NOT EXISTS {product}_count_ad AFTER DELETE ON {product} '
+        f'BEGIN {decrement} END',
+        f'CREATE TRIGGER IF NOT EXISTS {product}_count_au AFTER UPDATE OF category_id ON {product} '
+        f'BEGIN {decrement} {increment} END',
+    ]
+
+
+def install_count_triggers(model, category_model):
+    """Create the product_count triggers together with the product table."""
+    for statement in count_trigger_statements(model.__tablename__, category_model.__tablename__):
+        event.listen(model.__table__, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+
+
+# One-row counter bumped by every write to product, so a process can tell
+# that its in-memory read models missed writes made by other processes
+VERSION_TABLE = 'product_version'
+
+
+def version_statements(product, version_table=VERSION_TABLE):
+    """SQL creating ``version_table`` and the triggers bumping it on writes to ``product``."""
+    bump = f'UPDATE {version_table} SET version = version + 1;'
+    return [
+        f'CREATE TABLE IF NOT EXISTS {version_table} ('
+        f'id INTEGER NOT NULL PRIMARY KEY CHECK (id = 1), version INTEGER NOT NULL)',
+        f'INSERT OR IGNORE INTO {version_table} (id, version) VALUES (1, 0)',
+        f'CREATE TRIGGER IF NOT EXISTS {product}_version_ai AFTER INSERT ON {product} BEGIN {bump} END',
+        f'CREATE TRIGGER IF NOT EXISTS {product}_version_ad AFTER DELETE ON {product} BEGIN {bump} END',
+        f'CREATE TRIGGER IF NOT EXISTS {product}_version_au AFTER UPDATE ON {product} BEGIN {bump} END',
+    ]
+
+
+def install_version_triggers(model, version_table=VERSION_TABLE):
+    """Create the version table and its triggers together with the product table."""
+    table = model.__table__
+    for statement in version_statements(model.__tablename__, version_table):
+        event.listen(table, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+    event.listen(table, 'before_drop', DDL(f'DROP TABLE IF EXISTS {version_table}').execute_if(dialect='sqlite'))
+
+
+class CatalogView:
+    """Read-side view of the product catalog grouped by category.
+
+    Listings are returned as ProductCards rather than Product instances.
+    The category table is small and read on every page, so it is cached as
+    CategoryRows for ``category_ttl`` seconds or until a tracked commit.
+    Each category's product_count is kept up to date by triggers on the
+    product table, so every write path (ORM, Core or raw SQL) updates it.
+    """
+
+    def __init__(self, db, model, category_model, category_ttl=60, clock=time.monotonic):
+        self.db = db
+        self.model = model
+        self.category_model = category_model
+        self.category_ttl = category_ttl
+        self.clock = clock
+        self._categories = None  # (expires, [CategoryRow, ...])
+
+    def categories(self):
+        """Return all categories in display order."""
+        cached = self._categories
+        if cached is not None and cached[0] > self.clock():
+            return cached[1]
+        Category = self.category_model
+        rows = self.db.session.execute(
+            select(*[getattr(Category, field) for field in CATEGORY_FIELDS])
+            .order_by(Category.position, Category.id))
+        categories = [CategoryRow._make(row) for row in rows]
+        self._categories = (self.clock() + self.category_ttl, categories)
+        return categories
+
+    def category_for_slug(self, slug):
+        for category in self.categories():
+            if category.slug == slug:
+                return category
+        return None
+
+    def invalidate(self):
+        self._categories = None
+
+    def drop_count_triggers(self):
+        """Stop maintaining product_count, e.g. for a bulk load followed by create_count_triggers()."""
+        for suffix in ('ai', 'ad', 'au'):
+            self.db.session.execute(text(f'DROP TRIGGER IF EXISTS {self.model.__tablename__}_count_{suffix}'))
+        self.db.session.commit()
+
+    def create_count_triggers(self):
+        """Create the product_count triggers on an existing database and recount."""
+        product, category = self.model.__tablename__, self.category_model.__tablename__
+        for statement in count_trigger_statements(product, category):
+            self.db.session.execute(text(statement))
+        self.db.session.execute(text(
+            f'UPDATE {category} SET product_count = '
+            f'(SELECT count(*) FROM {product} WHERE {product}.category_id = {category}.id)'))
+        self.db.session.commit()
+        self.invalidate()
+
+    def version(self):
+        """Return the product write counter, see version_statements."""
+        return self.db.session.execute(text(f'SELECT version FROM {VERSION_TABLE}')).scalar()
+
+    def drop_version_triggers(self):
+        """Stop counting product writes, e.g. for a bulk load followed by create_version_triggers()."""
+        for suffix in ('ai', 'ad', 'au'):
+            self.db.session.execute(text(f'DROP TRIGGER IF EXISTS {self.model.__tablename__}_version_{suffix}'))
+        self.db.session.commit()
+
+    def create_version_triggers(self):
+        """Create the version triggers on an existing database and bump the version once."""
+        for statement in version_statements(self.model.__tablename__):
+            self.db.session.execute(text(statement))
+        self.db.session.execute(text(f'UPDATE {VERSION_TABLE} SET version = version + 1'))
+        self.db.session.commit()
+
+    def grouped(self, limit=None, sort='id'):
+        """Return an ordered mapping of CategoryRow -> products.
+
+        Without a limit products are loaded with a single query and bucketed
+        in one pass. With a limit each category is read as its own top-N
+        index range, so the cost no longer depends on the catalog size.
+        """
+        categories = self.categories()
+        if limit is not None:
+            return OrderedDict(
+                (category, self.page(category, limit=limit, sort=sort).items)
+                for category in categories
+            )
+        products_by_category = {category.id: [] for category in categories}
+        products = load_cards(self.db.session, select(*card_columns(self.model))
+                              .where(self.model.category_id.in_(products_by_category))
+                              .order_by(self.model.id))
+        for product in products:
+            products_by_category[product.category_id].append(product)
+        return OrderedDict((category, products_by_category[category.id]) for category in categories)
+
+    def page(self, category, after=None, limit=20, sort='id'):
+        """Return one keyset page of a CategoryRow's products ordered by ``sort``.
+
+        ``after`` is the ``next_cursor`` of the previous page. Raises
+        ValueError for an unknown sort key or a malformed cursor.
+        """
+        if sort not in SORT_KEYS:
+            raise ValueError(f'unknown sort key: {sort}')
+        descending = SORT_KEYS[sort]
+        table = self.model.__table__
+        column, id_column = table.c[sort], table.c.id
+        query = select(*card_columns(self.model)).where(self.model.category_id == category.id)
+        value = last_id = None
+        if after:
+            value, last_id = decode_cursor(after, column)
+
+        # Fetch one extra row to find out whether there is a next page
+        if descending and column.nullable:
+            # The NULLs, which sort last, are read as a second index range: an
+            # OR of both ranges could not seek and would scan from the start
+            items = []
+            if not after or value is not None:
+                seek = tuple_(column, id_column) < tuple_(value, last_id) if after else column.isnot(None)
+                items = load_cards(self.db.session, query.where(seek)
+                                   .order_by(column.desc(), id_column.desc()).limit(limit + 1))
+            if len(items) <= limit:
+                nulls = query.where(column.is_(None))
+                if after and value is None:
+                    nulls = nulls.where(id_column < last_id)
+                items += load_cards(self.db.session, nulls.order_by(id_column.desc())
+                                    .limit(limit + 1 - len(items)))
+        else:
+            if after:
+                query = query.where(_seek(column, id_column, value, last_id, descending))
+            if descending:
+                query = query.order_by(column.desc(), id_column.desc())
+            else:
+                query = query.order_by(column, id_column)
+            items = load_cards(self.db.session, query.limit(limit + 1))
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            next_cursor = encode_cursor(getattr(last, sort), last.id)
+        return CatalogPage(items, next_cursor)
@@ -0,0 +1,68 @@
+# commands.py
+import click
+from flask.cli import AppGroup, with_appcontext
+from sqlalchemy import inspect
+
+import migrations
+from extensions import db
+from models import Category, Product
+
+
+def add_books_to_db():
+    from seed_data import seed_books, seed_categories
+
+    categories = {}
+    for category in seed_categories:
+        categories[category['name']] = Category(**category)
+        db.session.add(categories[category['name']])
+    for book in seed_books:
+        db.session.add(Product(**dict(book, category=categories[book['category']])))
+
+    db.session.commit()
+
+db_cli = AppGroup('db', help='Manage the bookstore database.')
+
+@db_cli.command('init')
+@click.option('--drop', is_flag=True, help='Drop all existing tables first. Deletes all data.')
+def init_db_command(drop):
+    """Create the database tables."""
+    if drop:
+        db.drop_all()
+    fresh = not inspect(db.engine).has_table(Product.__tablename__)
+    if not fresh:
+        # create_all() would add the new tables next to the old schema, which
+        # the migrations then trip over
+        with db.engine.connect() as connection:
+            if migrations.pending(connection):
+                raise click.ClickException('The database schema is out of date; '
+                                           'run `flask db upgrade` instead.')
+    db.create_all()
+    if fresh:
+        # Tables made from the models already have the latest schema
+        migrations.stamp(db.engine)
+    click.echo('Initialized the database.')
+
+@db_cli.command('upgrade')
+def upgrade_db_command():
+    """Apply pending schema migrations to an existing database."""
+    applied = migrations.upgrade(db.engine, echo=click.echo)
+    click.echo(f'Applied {applied} migrations.' if applied else 'The database is up to date.')
+
+@db_cli.command('version')
+def db_version_command():
+    """Show the schema version and pending migrations."""
+    with db.engine.connect() as connection:
+        click.echo(f'Schema version {migrations.current_version(connection)} '
+                   f'(latest {migrations.latest_version()})')
+        for m in migrations.pending(connection):
+            click.echo(f'  pending {m.version}: {m.description}')
+
+@click.command('seed')
+@with_appcontext
+def seed_command():
+    """Load the sample catalog into an empty product table."""
+    if db.session.query(Product.id).first() is not None:
+        click.echo('Products already exist, skipping seed.')
+        return
+    add_books_to_db()
+    click.echo('Seeded the database.')
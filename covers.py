@@ -0,0 +1,250 @@
+# covers.py
+import hashlib
+import io
+import os
+import tempfile
+import threading
+import time
+import urllib.request
+from collections import OrderedDict, namedtuple
+from urllib.parse import urlparse
+
+from flask import current_app, request, send_file, send_from_directory, url_for
+
+try:
+    from PIL import Image
+except ImportError:  # Optional: without it the originals are served as they are
+    Image = None
+
+ONE_YEAR = 365 * 24 * 60 * 60
+MAX_COVER_BYTES = 10 * 1024 * 1024
+PLACEHOLDER = 'img/cover-placeholder.svg'
+LOCK_STRIPES = 64
+# A DiskLRU re-scans its directory after writing this fraction of its cap
+RESCAN_FRACTION = 16
+
+IMAGE_SIGNATURES = (
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+)
+
+
+def fetch_url(url, timeout):
+    """Default fetcher: download ``url`` over HTTP(S) and return the body."""
+    if urlparse(url).scheme not in ('http', 'https'):
+        raise ValueError(f'unsupported cover URL: {url}')
+    upstream = urllib.request.Request(url, headers={'User-Agent': 'PaperbackCollections/1.0'})
+    with urllib.request.urlopen(upstream, timeout=timeout) as response:
+        body = response.read(MAX_COVER_BYTES + 1)
+    if len(body) > MAX_COVER_BYTES:
+        raise ValueError(f'cover too large: {url}')
+    return body
+
+
+def image_mimetype(path):
+    """Return the MIME type of the image file at ``path`` from its first bytes, or None."""
+    with open(path, 'rb') as f:
+        head = f.read(12)
+    for signature, mimetype in IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return mimetype
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'image/webp'
+    return None
+
+
+def resize_cover(data, width):
+    """Return ``data`` as a progressive JPEG at most ``width`` pixels wide; needs Pillow."""
+    with Image.open(io.BytesIO(data)) as image:
+        image = image.convert('RGB')
+        if image.width > width:
+            image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+        output = io.BytesIO()
+        image.save(output, format='JPEG', quality=82, optimize=True, progressive=True)
+    return output.getvalue()
+
+
+class DiskLRU:
+    """Files in one directory, evicting the least recently used past ``max_bytes``.
+
+    Recency is the file mtime, which is bumped on every hit, so the order
+    survives restarts and is roughly shared between worker processes. Each
+    process only tracks its own writes, so it re-scans the directory once it
+    has written ``max_bytes / RESCAN_FRACTION`` or its total passes the cap;
+    with N workers the directory can exceed ``max_bytes`` by up to N times
+    that fraction.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._entries = None  # name -> size, least recently used first
+        self._size = 0
+        self._written = 0  # Bytes put since the last scan
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._entries is None:
+            self._scan()
+
+    def _scan(self):
+        os.makedirs(self.directory, exist_ok=True)
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.startswith('.'):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name, stat.st_size))
+        self._entries = OrderedDict((name, size) for _, name, size in sorted(files))
+        self._size = sum(self._entries.values())
+        self._written = 0
+
+    def get(self, name):
+        """Return the path of a cached file, or None."""
+        path = os.path.join(self.directory, name)
+        with self._lock:
+            self._load()
+            if name not in self._entries:
+                return None
+            try:
+                os.utime(path)
+            except OSError:  # Evicted by another process
+                self._size -= self._entries.pop(name)
+                return None
+            self._entries.move_to_end(name)
+        return path
+
+    def put(self, name, data):
+        with self._lock:
+            self._load()
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix='.')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            path = os.path.join(self.directory, name)
+            os.replace(temp_path, path)
+            self._size += len(data) - self._entries.pop(name, 0)
+            self._entries[name] = len(data)
+            self._written += len(data)
+            if self._size > self.max_bytes or self._written > self.max_bytes // RESCAN_FRACTION:
+                self._scan()  # Picks up files other processes wrote or evicted
+            while self._size > self.max_bytes and len(self._entries) > 1:
+                evicted, size = self._entries.popitem(last=False)
+                self._size -= size
+                try:
+                    os.remove(os.path.join(self.directory, evicted))
+                except OSError:
+                    pass
+        return path
+
+
+# Per-app state: the DiskLRU and image URL -> retry time of failed fetches
+CoverState = namedtuple('CoverState', ['cache', 'failures'])
+
+
+class CoverCache:
+    """Local caching proxy for remote product cover images.
+
+    Each upstream image is fetched once and kept, together with resized
+    JPEG derivatives, in a size-capped on-disk LRU cache. Without Pillow the
+    original is served at every width, under the type its bytes show. Covers are served
+    as immutable when the URL carries the current version of the image URL.
+    When the upstream fetch fails a placeholder is served with a short max-age,
+    and the upstream is not retried for COVER_RETRY_AFTER seconds.
+
+    ``fetcher(url, timeout)`` returns the image bytes and can be replaced,
+    e.g. by tests, to avoid network access. ``endpoint`` is the view serving
+    covers, which ``cover_url`` builds URLs for. Each app has its own disk
+    cache and failed fetches, kept in ``app.extensions['covers']``.
+    """
+
+    def __init__(self, app=None, fetcher=fetch_url, endpoint='product_cover'):
+        self.fetcher = fetcher
+        self.endpoint = endpoint
+        self._locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('COVER_CACHE_DIR', os.path.join(app.instance_path, 'cover-cache'))
+        app.config.setdefault('COVER_CACHE_MAX_BYTES', 512 * 1024 * 1024)
+        app.config.setdefault('COVER_WIDTHS', (200, 400, 600))
+        app.config.setdefault('COVER_FETCH_TIMEOUT', 5)
+        app.config.setdefault('COVER_RETRY_AFTER', 300)
+        app.extensions['covers'] = CoverState(
+            DiskLRU(app.config['COVER_CACHE_DIR'], app.config['COVER_CACHE_MAX_BYTES']),
+            {},  # image URL -> time after which to retry
+        )
+        app.add_template_global(self.cover_url, 'cover_url')
+
+    @staticmethod
+    def version(image_url):
+        return hashlib.sha256(image_url.encode()).hexdigest()[:16]
+
+    def cover_url(self, product, width):
+        return url_for(self.endpoint, product_id=product.id, width=width,
+                       v=self.version(product.image))
+
+    def _lock_for(self, key):
+        return self._locks[hash(key) % LOCK_STRIPES]
+
+    def _original(self, image_url, version):
+        cache, failures = current_app.extensions['covers']
+        name = f'{version}-original'
+        path = cache.get(name)
+        if path is not None:
+            with open(path, 'rb') as f:
+                return f.read()
+        if failures.get(image_url, 0) > time.monotonic():
+            return None
+        try:
+            data = self.fetcher(image_url, current_app.config['COVER_FETCH_TIMEOUT'])
+        except Exception as exc:
+            current_app.logger.warning('Fetching cover %s failed: %s', image_url, exc)
+            failures[image_url] = time.monotonic() + current_app.config['COVER_RETRY_AFTER']
+            return None
+        failures.pop(image_url, None)
+        cache.put(name, data)
+        return data
+
+    def cover(self, image_url, width):
+        """Return the path of the cached cover at ``width``, or None if unavailable."""
+        cache = current_app.extensions['covers'].cache
+        version = self.version(image_url)
+        name = f'{version}-{width}.jpg'
+        path = cache.get(name)
+        if path is not None:
+            return path
+        # One fetch and resize per cover, however many requests arrive at once
+        with self._lock_for(name):
+            path = cache.get(name)
+            if path is not None:
+                return path
+            data = self._original(image_url, version)
+            if data is None:
+                return None
+            if Image is None:
+                return cache.get(f'{version}-original')
+            try:
+                resized = resize_cover(data, width)
+            except OSError as exc:  # Not an image Pillow can read
+                current_app.logger.warning('Resizing cover %s failed: %s', image_url, exc)
+                return None
+            return cache.put(name, resized)
+
+    def send_cover(self, image_url, width):
+        path = self.cover(image_url, width)
+        mimetype = None
+        if path is not None:
+            mimetype = 'image/jpeg' if Image is not None else image_mimetype(path)
+        if mimetype is None:  # Unavailable, or not an image
+            response = send_from_directory(current_app.static_folder, PLACEHOLDER, max_age=60)
+            response.cache_control.public = True
+            return response
+        immutable = request.args.get('v') == self.version(image_url)
+        response = send_file(path, mimetype=mimetype,
+                             max_age=ONE_YEAR if immutable else 3600)
+        response.cache_control.public = True
+        if immutable:
+            response.cache_control.immutable = True
+        return response
@@ -0,0 +1,20 @@
+# extensions.py
+# Extension instances shared by the models and views; create_app() binds them
+# to the app with init_app. Per-app state lives in app.extensions, so several
+# apps (e.g. in tests) can share these objects.
+from flask_sqlalchemy import SQLAlchemy
+
+from assets import StaticAssets
+from covers import CoverCache
+from fragments import FragmentCache
+from images import ResponsiveImages
+from pagecache import PageCache
+from storage import StorageProfile
+
+storage = StorageProfile()  # Sets pool options, so before db.init_app
+db = SQLAlchemy()
+assets = StaticAssets()  # Content-hashed static URLs with long-lived caching
+images = ResponsiveImages()  # responsive_image() template helper
+covers = CoverCache(endpoint='shop.product_cover')  # Local copies of remote cover images
+page_cache = PageCache()  # Whole pages for anonymous visitors
+fragment_cache = FragmentCache()  # {% cache %} tag, e.g. for product cards
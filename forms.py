@@ -1,10 +1,24 @@
-# paperbackcollections/forms.py
+# forms.py
 from flask_wtf import FlaskForm
-from wtforms import StringField, TextAreaField, IntegerField, SubmitField
-from wtforms.validators import DataRequired, Email, NumberRange
+from wtforms import HiddenField, StringField, IntegerField, SubmitField
+from wtforms.validators import DataRequired, Email, Length, NumberRange
+
+from cart_store import MAX_QUANTITY
+
+
+class AddToBasketForm(FlaskForm):
+    # No CSRF token, so product pages are the same for every visitor and can
+    # be cached; adding to a cart is also possible with a plain GET link
+    class Meta:
+        csrf = False
+
+    quantity = IntegerField('Quantity', default=1, validators=[DataRequired(), NumberRange(min=1, max=MAX_QUANTITY)])
+    submit = SubmitField('Add to Basket')
+
 
 class CheckoutForm(FlaskForm):
     name = StringField('Name', validators=[DataRequired()])
-    address = TextAreaField('Address', validators=[DataRequired()])
+    address = StringField('Address', validators=[DataRequired()])
     email = StringField('Email', validators=[DataRequired(), Email()])
-    submit = SubmitField('Place Order')
+    idempotency_key = HiddenField(validators=[DataRequired(), Length(max=64)])
+    submit = SubmitField('Submit')
@@ -0,0 +1,61 @@
+# fragments.py
+from flask import current_app
+from jinja2 import nodes
+from jinja2.ext import Extension
+
+from pagecache import MemoryBackend
+
+
+class FragmentCacheExtension(Extension):
+    """``{% cache key, ttl %}...{% endcache %}`` keeps the rendered block.
+
+    The key is any hashable expression and should include a version of the
+    data the block shows, e.g. ``('product-card', product.id, product.updated_at)``,
+    so a change renders a new entry instead of needing an invalidation. ``ttl``
+    is optional. Nothing is cached while templates auto-reload (debug mode).
+    """
+
+    tags = {'cache'}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.extend(fragment_cache=None, fragment_cache_ttl=3600)
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression()]
+        if parser.stream.skip_if('comma'):
+            args.append(parser.parse_expression())
+        else:
+            args.append(nodes.Const(None))
+        body = parser.parse_statements(('name:endcache',), drop_needle=True)
+        return nodes.CallBlock(self.call_method('_render', args), [], [], body).set_lineno(lineno)
+
+    def _render(self, key, ttl, caller):
+        cache = self.environment.fragment_cache
+        if cache is None or self.environment.auto_reload:
+            return caller()
+        html = cache.get(key)
+        if html is None:
+            html = caller()
+            cache.set(key, html, ttl or self.environment.fragment_cache_ttl)
+        return html
+
+
+class FragmentCache:
+    """Enable the ``{% cache %}`` tag in the app's templates, backed by a bounded LRU."""
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('FRAGMENT_CACHE_MAX_ENTRIES', 4096)
+        app.config.setdefault('FRAGMENT_CACHE_TTL', 3600)
+        app.jinja_env.add_extension(FragmentCacheExtension)
+        app.jinja_env.fragment_cache = MemoryBackend(max_entries=app.config['FRAGMENT_CACHE_MAX_ENTRIES'])
+        app.jinja_env.fragment_cache_ttl = app.config['FRAGMENT_CACHE_TTL']
+        app.extensions['fragment_cache'] = self
+
+    def clear(self):
+        current_app.jinja_env.fragment_cache.clear()
@@ -0,0 +1,164 @@
+# images.py
+import json
+import os
+import threading
+
+import click
+from flask import current_app, url_for
+from flask.cli import AppGroup
+from markupsafe import Markup, escape
+
+try:
+    from PIL import Image
+except ImportError:  # Optional: only needed to build derivatives
+    Image = None
+
+# Derivatives live under static/ so they get fingerprinted, long-cached URLs
+DERIVED_DIR = 'derived'
+MANIFEST_NAME = 'manifest.json'
+SOURCE_DIRS = ('img',)
+SOURCE_EXTENSIONS = {'.jpg', '.jpeg', '.png'}
+
+WIDTHS = (320, 640, 960, 1280, 1920)
+FALLBACK_WIDTH = 960  # For browsers without srcset support
+# Derivative format -> (MIME type, Pillow save options)
+FORMATS = {
+    'webp': ('image/webp', {'format': 'WEBP', 'quality': 80, 'method': 6}),
+    'jpg': ('image/jpeg', {'format': 'JPEG', 'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+
+def derivative_widths(width):
+    # Never upscale; images narrower than the largest width also get a
+    # derivative at their own width
+    widths = [w for w in WIDTHS if w < width]
+    if width <= WIDTHS[-1]:
+        widths.append(width)
+    return widths
+
+
+def derivative_name(filename, width, fmt):
+    root = os.path.splitext(filename)[0]
+    return f'{DERIVED_DIR}/{root}-{width}w.{fmt}'
+
+
+def build_derivatives(static_folder, filename):
+    """Write every width and format of one static image; returns its manifest entry."""
+    with Image.open(os.path.join(static_folder, filename)) as source:
+        source = source.convert('RGB')
+        entry = {'widths': [], 'height': {}}
+        for width in derivative_widths(source.width):
+            height = round(source.height * width / source.width)
+            resized = source if width == source.width else source.resize((width, height), Image.LANCZOS)
+            for fmt, (_, options) in FORMATS.items():
+                path = os.path.join(static_folder, derivative_name(filename, width, fmt))
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                resized.save(path, **options)
+            entry['widths'].append(width)
+            entry['height'][str(width)] = height
+    return entry
+
+
+class ResponsiveImages:
+    """Jinja helper emitting <picture> markup with srcset/sizes for static images.
+
+    Derivatives are built ahead of time by ``flask images build`` and listed in
+    a manifest together with the digest of their source image. Images without
+    up-to-date derivatives fall back to a plain <img> of the original file.
+    """
+
+    def __init__(self, app=None):
+        self._manifests = {}  # path -> (mtime_ns, manifest)
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.add_template_global(self.responsive_image, 'responsive_image')
+        app.extensions['responsive_images'] = self
+        app.cli.add_command(images_cli)
+
+    def manifest_path(self):
+        return os.path.join(current_app.static_folder, DERIVED_DIR, MANIFEST_NAME)
+
+    def manifest(self):
+        path = self.manifest_path()
+        cached = self._manifests.get(path)
+        if cached is not None and not current_app.debug:
+            return cached[1]
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        if cached is None or mtime != cached[0]:
+            manifest = {}
+            if mtime is not None:
+                with open(path, encoding='utf-8') as f:
+                    manifest = json.load(f)
+            cached = (mtime, manifest)
+            with self._lock:
+                self._manifests[path] = cached
+        return cached[1]
+
+    def derivatives(self, filename):
+        """Return the manifest entry for ``filename`` if its derivatives are current."""
+        entry = self.manifest().get(filename)
+        assets = current_app.extensions['static_assets']
+        if entry is None or entry['digest'] != assets.digest(filename):
+            return None
+        return entry
+
+    def responsive_image(self, filename, alt='', sizes='100vw', **attrs):
+        attributes = ''.join(f' {name}="{escape(value)}"' for name, value in attrs.items())
+        entry = self.derivatives(filename)
+        if entry is None:
+            return Markup(f'<img src="{escape(url_for("static", filename=filename))}" '
+                          f'alt="{escape(alt)}"{attributes}>')
+
+        def srcset(fmt):
+            return ', '.join(
+                f'{url_for("static", filename=derivative_name(filename, width, fmt))} {width}w'
+                for width in entry['widths'])
+
+        largest = entry['widths'][-1]
+        fallback_width = max([w for w in entry['widths'] if w <= FALLBACK_WIDTH] or entry['widths'][:1])
+        fallback = url_for('static', filename=derivative_name(filename, fallback_width, 'jpg'))
+        return Markup(
+            f'<picture>'
+            f'<source type="{FORMATS["webp"][0]}" srcset="{escape(srcset("webp"))}" sizes="{escape(sizes)}">'
+            f'<img src="{escape(fallback)}" srcset="{escape(srcset("jpg"))}" sizes="{escape(sizes)}" '
+            f'width="{largest}" height="{entry["height"][str(largest)]}" alt="{escape(alt)}"{attributes}>'
+            f'</picture>'
+        )
+
+
+images_cli = AppGroup('images', help='Build responsive image derivatives.')
+
+
+@images_cli.command('build')
+@click.option('--force', is_flag=True, help='Rebuild derivatives that are already current.')
+def build_command(force):
+    """Write resized WebP and progressive JPEG derivatives of static images."""
+    if Image is None:
+        raise click.ClickException('Pillow is required to build image derivatives.')
+    images = current_app.extensions['responsive_images']
+    assets = current_app.extensions['static_assets']
+    static_folder = current_app.static_folder
+    manifest = dict(images.manifest())
+    for source_dir in SOURCE_DIRS:
+        for directory, _, files in os.walk(os.path.join(static_folder, source_dir)):
+            for name in sorted(files):
+                if os.path.splitext(name)[1].lower() not in SOURCE_EXTENSIONS:
+                    continue
+                filename = os.path.relpath(os.path.join(directory, name), static_folder).replace(os.sep, '/')
+                digest = assets.digest(filename)
+                if not force and manifest.get(filename, {}).get('digest') == digest:
+                    continue
+                entry = build_derivatives(static_folder, filename)
+                entry['digest'] = digest
+                manifest[filename] = entry
+                click.echo(f'{filename}: {", ".join(str(width) for width in entry["widths"])}')
+    path = images.manifest_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
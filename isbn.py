@@ -0,0 +1,49 @@
+# isbn.py
+import re
+
+# Products store ISBNs in one canonical form: the 13 digit ISBN-13 without
+# separators. ISBN-10s are converted, so either form finds the same book.
+_SEPARATORS = re.compile(r'[\s-]')
+_PREFIX = re.compile(r'^ISBN(?:-1[03])?:?', re.IGNORECASE)
+
+
+def isbn10_check_digit(digits):
+    """Check digit ('0'-'9' or 'X') for the first nine digits of an ISBN-10."""
+    remainder = sum((10 - i) * int(d) for i, d in enumerate(digits)) % 11
+    check = (11 - remainder) % 11
+    return 'X' if check == 10 else str(check)
+
+
+def isbn13_check_digit(digits):
+    """Check digit for the first twelve digits of an ISBN-13."""
+    total = sum(int(d) * (3 if i % 2 else 1) for i, d in enumerate(digits))
+    return str((10 - total % 10) % 10)
+
+
+def normalize_isbn(value):
+    """Return ``value`` as a canonical ISBN-13, e.g. ``'0-306-40615-2'`` ->
+    ``'9780306406157'``.
+
+    Accepts ISBN-10 and ISBN-13 with or without hyphens, spaces and an
+    ``ISBN`` prefix. Raises ValueError for anything else, including a wrong
+    check digit.
+    """
+    compact = _SEPARATORS.sub('', _PREFIX.sub('', str(value).strip())).upper()
+    if len(compact) == 10 and compact[:9].isdigit() and (compact[9].isdigit() or compact[9] == 'X'):
+        if isbn10_check_digit(compact[:9]) != compact[9]:
+            raise ValueError(f'invalid ISBN check digit: {value!r}')
+        compact = '978' + compact[:9]
+        return compact + isbn13_check_digit(compact)
+    if len(compact) == 13 and compact.isdigit() and compact[:3] in ('978', '979'):
+        if isbn13_check_digit(compact[:12]) != compact[12]:
+            raise ValueError(f'invalid ISBN check digit: {value!r}')
+        return compact
+    raise ValueError(f'invalid ISBN: {value!r}')
+
+
+def parse_isbn(value):
+    """Like normalize_isbn, but returns None instead of raising."""
+    try:
+        return normalize_isbn(value)
+    except ValueError:
+        return None
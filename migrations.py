@@ -0,0 +1,278 @@
+# migrations.py
+"""Versioned schema migrations for existing databases.
+
+The schema version is SQLite's ``PRAGMA user_version``. ``flask db upgrade``
+runs every migration above it in order, each in its own transaction together
+with the version bump, so a failed migration leaves the previous version in
+place. A database created from the models by ``flask db init`` is stamped
+with the latest version, since it already has the current schema.
+
+Migrations are plain SQL against the schema as it was at that version, not
+the models, so they keep working as the models change. Index builds take
+SQLite's write lock for their duration; with the WAL storage profile
+readers carry on meanwhile.
+"""
+from collections import namedtuple
+from datetime import datetime, timezone
+
+Migration = namedtuple('Migration', ['version', 'description', 'upgrade'])
+
+MIGRATIONS = []
+
+
+def migration(version, description):
+    """Register ``upgrade(connection)`` as the migration to ``version``."""
+    def decorator(upgrade):
+        if MIGRATIONS and version != MIGRATIONS[-1].version + 1:
+            raise ValueError(f'migration {version} is out of sequence')
+        MIGRATIONS.append(Migration(version, description, upgrade))
+        return upgrade
+    return decorator
+
+
+def latest_version():
+    return MIGRATIONS[-1].version if MIGRATIONS else 0
+
+
+def current_version(connection):
+    return connection.exec_driver_sql('PRAGMA user_version').scalar()
+
+
+def pending(connection):
+    version = current_version(connection)
+    return [m for m in MIGRATIONS if m.version > version]
+
+
+def upgrade(engine, echo=print):
+    """Apply pending migrations; returns the number applied."""
+    with engine.connect() as connection:
+        migrations = pending(connection)
+    for m in migrations:
+        echo(f'Migrating to version {m.version}: {m.description}')
+        with engine.begin() as connection:
+            # pysqlite does not open a transaction for DDL on its own;
+            # IMMEDIATE takes the write lock up front
+            connection.exec_driver_sql('BEGIN IMMEDIATE')
+            if current_version(connection) >= m.version:
+                continue  # Applied by another process meanwhile
+            m.upgrade(connection)
+            connection.exec_driver_sql(f'PRAGMA user_version = {m.version}')
+    return len(migrations)
+
+
+def stamp(engine, version=None):
+    """Record ``version`` (default: latest) without running migrations."""
+    with engine.begin() as connection:
+        connection.exec_driver_sql(f'PRAGMA user_version = {latest_version() if version is None else version}')
+
+
+def _columns(connection, table):
+    return [row[1] for row in connection.exec_driver_sql(f'PRAGMA table_info("{table}")')]
+
+
+def _original_schema(connection):
+    """Bring the schema the app first shipped with up to the one migration 1
+    was written against; a no-op on databases created after that.
+
+    Those databases were never stamped, so they are also at version 0; each
+    step checks for what it adds.
+    """
+    from catalog import summarize
+
+    now = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S.%f')
+    product = _columns(connection, 'product')
+    if 'summary' not in product:
+        # SQLite cannot add a NOT NULL column without a default; every row is filled below
+        connection.exec_driver_sql("ALTER TABLE product ADD COLUMN summary VARCHAR(100) NOT NULL DEFAULT ''")
+        summaries = [(summarize(description), product_id) for product_id, description
+                     in connection.exec_driver_sql('SELECT id, description FROM product')]
+        if summaries:
+            connection.exec_driver_sql('UPDATE product SET summary = ? WHERE id = ?', summaries)
+    if 'updated_at' not in product:
+        connection.exec_driver_sql(
+            f"ALTER TABLE product ADD COLUMN updated_at DATETIME NOT NULL DEFAULT '{now}'")
+    if 'checkout_key' not in _columns(connection, 'order'):
+        # Earlier orders have no checkout or customer; each gets a key of its own
+        connection.exec_driver_sql(
+            'CREATE TABLE order_new ('
+            'id INTEGER NOT NULL PRIMARY KEY, '
+            'product_id INTEGER NOT NULL REFERENCES product (id), '
+            'quantity INTEGER NOT NULL, '
+            'checkout_key VARCHAR(64) NOT NULL, '
+            'customer_name VARCHAR(100) NOT NULL, '
+            'customer_address VARCHAR(500) NOT NULL, '
+            'customer_email VARCHAR(100) NOT NULL, '
+            'created_at DATETIME NOT NULL, '
+            'CONSTRAINT uq_order_checkout_product UNIQUE (checkout_key, product_id))')
+        connection.exec_driver_sql(
+            'INSERT INTO order_new (id, product_id, quantity, checkout_key, customer_name, '
+            "customer_address, customer_email, created_at) "
+            "SELECT id, product_id, quantity, 'legacy-' || id, '', '', '', ? FROM \"order\"", (now,))
+        connection.exec_driver_sql('DROP TABLE "order"')
+        connection.exec_driver_sql('ALTER TABLE order_new RENAME TO "order"')
+    if 'token' not in _columns(connection, 'cart'):
+        # The old lines made up one cart shared by every visitor, which no
+        # session's token can claim, so they are dropped
+        connection.exec_driver_sql('DROP TABLE cart')
+        connection.exec_driver_sql(
+            'CREATE TABLE cart ('
+            'id INTEGER NOT NULL PRIMARY KEY, '
+            'token VARCHAR(64) NOT NULL, '
+            'product_id INTEGER NOT NULL REFERENCES product (id), '
+            'quantity INTEGER NOT NULL, '
+            'CONSTRAINT uq_cart_token_product UNIQUE (token, product_id))')
+    if not connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'product_fts'").first():
+        row = "id, title, author, description, upper(replace(isbn, '-', ''))"
+        new_row = "new.id, new.title, new.author, new.description, upper(replace(new.isbn, '-', ''))"
+        connection.exec_driver_sql(
+            "CREATE VIRTUAL TABLE product_fts USING fts5(title, author, description, isbn, "
+            "tokenize='unicode61 remove_diacritics 2', prefix='2 3')")
+        connection.exec_driver_sql(
+            'CREATE TRIGGER product_fts_ai AFTER INSERT ON product BEGIN '
+            f'INSERT INTO product_fts(rowid, title, author, description, isbn) VALUES ({new_row}); END')
+        connection.exec_driver_sql(
+            'CREATE TRIGGER product_fts_ad AFTER DELETE ON product BEGIN '
+            'DELETE FROM product_fts WHERE rowid = old.id; END')
+        connection.exec_driver_sql(
+            'CREATE TRIGGER product_fts_au AFTER UPDATE OF title, author, description, isbn ON product BEGIN '
+            'DELETE FROM product_fts WHERE rowid = old.id; '
+            f'INSERT INTO product_fts(rowid, title, author, description, isbn) VALUES ({new_row}); END')
+        connection.exec_driver_sql(
+            f'INSERT INTO product_fts(rowid, title, author, description, isbn) SELECT {row} FROM product')
+    # The category listing indexes of that schema are left out: migration 3
+    # replaces them
+
+
+@migration(1, 'bring the original schema up to date; index product isbn and author, '
+              'cart and order product_id')
+def add_lookup_indexes(connection):
+    _original_schema(connection)
+    connection.exec_driver_sql('CREATE INDEX IF NOT EXISTS ix_product_isbn ON product (isbn)')
+    connection.exec_driver_sql('CREATE INDEX IF NOT EXISTS ix_product_author ON product (author)')
+    connection.exec_driver_sql('CREATE INDEX IF NOT EXISTS ix_cart_product_id ON cart (product_id)')
+    connection.exec_driver_sql('CREATE INDEX IF NOT EXISTS ix_order_product_id ON "order" (product_id)')
+
+
+@migration(2, 'store product prices as integer cents with a currency')
+def price_cents(connection):
+    connection.exec_driver_sql('ALTER TABLE product ADD COLUMN price_cents INTEGER NOT NULL DEFAULT 0')
+    connection.exec_driver_sql("ALTER TABLE product ADD COLUMN currency VARCHAR(3) NOT NULL DEFAULT 'USD'")
+    connection.exec_driver_sql('UPDATE product SET price_cents = CAST(round(price * 100) AS INTEGER)')
+    connection.exec_driver_sql('ALTER TABLE product DROP COLUMN price')  # SQLite 3.35+
+
+
+@migration(3, 'move product categories to a category table')
+def category_table(connection):
+    # An earlier `flask db init` on this version could create an empty one
+    if connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'category'").first():
+        if connection.exec_driver_sql('SELECT 1 FROM category').first():
+            raise RuntimeError('a category table with rows already exists')
+        connection.exec_driver_sql('DROP TABLE category')
+    connection.exec_driver_sql(
+        'CREATE TABLE category ('
+        'id INTEGER NOT NULL PRIMARY KEY, '
+        'name VARCHAR(100) NOT NULL UNIQUE, '
+        'slug VARCHAR(100) NOT NULL UNIQUE, '
+        'position INTEGER NOT NULL, '
+        'image VARCHAR(200), '
+        'product_count INTEGER NOT NULL)')
+    # The four categories the home page used to hard-code keep their order
+    # and images; any others follow alphabetically
+    connection.exec_driver_sql(
+        "INSERT INTO category (name, slug, position, image, product_count) "
+        "SELECT category, lower(replace(category, ' ', '-')), "
+        "CASE category WHEN 'Fiction' THEN 1 WHEN 'Non Fiction' THEN 2 "
+        "WHEN 'Science Fiction' THEN 3 WHEN 'Biography' THEN 4 ELSE 5 END, "
+        "CASE category WHEN 'Fiction' THEN 'img/fiction.jpg' WHEN 'Non Fiction' THEN 'img/nonfiction.jpg' "
+        "WHEN 'Science Fiction' THEN 'img/scifi.jpg' WHEN 'Biography' THEN 'img/biography.jpg' END, "
+        "count(*) FROM product GROUP BY category ORDER BY 3, 1")
+    # SQLite cannot add a NOT NULL column without a default; every row is filled below
+    connection.exec_driver_sql('ALTER TABLE product ADD COLUMN category_id INTEGER REFERENCES category (id)')
+    connection.exec_driver_sql(
+        'UPDATE product SET category_id = (SELECT id FROM category WHERE category.name = product.category)')
+    for name in ('id', 'published_on', 'rating'):
+        connection.exec_driver_sql(f'DROP INDEX IF EXISTS ix_product_category_{name}')
+    connection.exec_driver_sql('ALTER TABLE product DROP COLUMN category')
+    connection.exec_driver_sql('CREATE INDEX ix_product_category_id ON product (category_id, id)')
+    connection.exec_driver_sql(
+        'CREATE INDEX ix_product_category_published_on ON product (category_id, published_on, id)')
+    connection.exec_driver_sql('CREATE INDEX ix_product_category_rating ON product (category_id, rating, id)')
+    connection.exec_driver_sql(
+        'CREATE TRIGGER product_count_ai AFTER INSERT ON product BEGIN '
+        'UPDATE category SET product_count = product_count + 1 WHERE id = new.category_id; END')
+    connection.exec_driver_sql(
+        'CREATE TRIGGER product_count_ad AFTER DELETE ON product BEGIN '
+        'UPDATE category SET product_count = product_count - 1 WHERE id = old.category_id; END')
+    connection.exec_driver_sql(
+        'CREATE TRIGGER product_count_au AFTER UPDATE OF category_id ON product BEGIN '
+        'UPDATE category SET product_count = product_count - 1 WHERE id = old.category_id; '
+        'UPDATE category SET product_count = product_count + 1 WHERE id = new.category_id; END')
+
+
+@migration(4, 'store canonical ISBN-13s under a unique index')
+def canonical_isbn(connection):
+    from isbn import parse_isbn
+
+    # SQLite cannot drop NOT NULL from a column, so the table is rebuilt
+    # with a nullable isbn, keeping ids, then indexes and triggers restored.
+    # Invalid ISBNs and all but the first product sharing one become NULL.
+    columns = _columns(connection, 'product')
+    expected = ['id', 'title', 'author', 'price_cents', 'currency', 'description', 'summary', 'isbn',
+                'category_id', 'image', 'publisher', 'published_on', 'rating', 'reviews', 'updated_at']
+    if sorted(columns) != sorted(expected):
+        # Copying into the rebuilt table would fail halfway or lose a column
+        raise RuntimeError('product has columns %s, expected %s' % (', '.join(columns), ', '.join(expected)))
+    canonical, seen = {}, set()
+    for product_id, value in connection.exec_driver_sql('SELECT id, isbn FROM product ORDER BY id'):
+        isbn = parse_isbn(value)
+        if isbn in seen:
+            isbn = None
+        seen.add(isbn)
+        if isbn != value:
+            canonical[product_id] = isbn
+    schema = connection.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE tbl_name = 'product' AND type IN ('index', 'trigger') "
+        "AND name != 'ix_product_isbn' AND sql IS NOT NULL").scalars().all()
+    connection.exec_driver_sql(
+        'CREATE TABLE product_new ('
+        'id INTEGER NOT NULL PRIMARY KEY, '
+        'title VARCHAR(100) NOT NULL, '
+        'author VARCHAR(100) NOT NULL, '
+        'price_cents INTEGER NOT NULL, '
+        'currency VARCHAR(3) NOT NULL, '
+        'description VARCHAR(500) NOT NULL, '
+        'summary VARCHAR(100) NOT NULL, '
+        'isbn VARCHAR(13), '
+        'category_id INTEGER NOT NULL REFERENCES category (id), '
+        'image VARCHAR(500) NOT NULL, '
+        'publisher VARCHAR(100) NOT NULL, '
+        'published_on DATETIME NOT NULL, '
+        'rating FLOAT, '
+        'reviews INTEGER, '
+        'updated_at DATETIME NOT NULL)')
+    copied = ', '.join(columns)
+    connection.exec_driver_sql(f'INSERT INTO product_new ({copied}) SELECT {copied} FROM product')
+    connection.exec_driver_sql('DROP TABLE product')
+    connection.exec_driver_sql('ALTER TABLE product_new RENAME TO product')
+    for statement in schema:
+        connection.exec_driver_sql(statement)
+    # Updated with the triggers back in place, so the search index follows;
+    # updated_at changes the product pages' validators
+    if canonical:
+        now = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S.%f')
+        connection.exec_driver_sql('UPDATE product SET isbn = ?, updated_at = ? WHERE id = ?',
+                                   [(isbn, now, product_id) for product_id, isbn in canonical.items()])
+    connection.exec_driver_sql('CREATE UNIQUE INDEX ix_product_isbn ON product (isbn)')
+
+
+@migration(5, 'count product writes in a product_version row')
+def product_version(connection):
+    connection.exec_driver_sql(
+        'CREATE TABLE product_version (id INTEGER NOT NULL PRIMARY KEY CHECK (id = 1), version INTEGER NOT NULL)')
+    connection.exec_driver_sql('INSERT INTO product_version (id, version) VALUES (1, 0)')
+    for suffix, operation in (('ai', 'INSERT'), ('ad', 'DELETE'), ('au', 'UPDATE')):
+        connection.exec_driver_sql(
+            f'CREATE TRIGGER product_version_{suffix} AFTER {operation} ON product BEGIN '
+            'UPDATE product_version SET version = version + 1; END')
@@ -1,24 +1,120 @@
-# paperbackcollections/models.py
-from . import db
+# models.py
+from datetime import datetime, timezone
+
+from flask import current_app
+from sqlalchemy.orm import validates
+from werkzeug.local import LocalProxy
+
+import suggest
+from cart_store import create_cart_store
+from catalog import CatalogView, install_count_triggers, install_version_triggers, summarize
+from extensions import db, page_cache
+from isbn import normalize_isbn
+from money import DEFAULT_CURRENCY
+from search import install_index, SearchIndex
+from session_events import on_commit_of
+
+
+def utcnow():
+    # Naive UTC, as stored in the DateTime columns; datetime.utcnow() is deprecated
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class Category(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False, unique=True)
+    slug = db.Column(db.String(100), nullable=False, unique=True)
+    position = db.Column(db.Integer, nullable=False, default=0)  # Display order
+    image = db.Column(db.String(200), nullable=True)  # Static image shown on the home page
+    # Kept up to date by triggers on product, see CatalogView
+    product_count = db.Column(db.Integer, nullable=False, default=0)
 
 class Product(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(100), nullable=False)
-    description = db.Column(db.Text, nullable=False)
-    price = db.Column(db.Float, nullable=False)
-    category = db.Column(db.String(50), nullable=False)
-    image = db.Column(db.String(100), nullable=False)
+    title = db.Column(db.String(100), nullable=False)
+    author = db.Column(db.String(100), nullable=False)
+    price_cents = db.Column(db.Integer, nullable=False)  # Price in minor units of currency
+    currency = db.Column(db.String(3), nullable=False, default=DEFAULT_CURRENCY)
+    description = db.Column(db.String(500), nullable=False)
+    summary = db.Column(db.String(100), nullable=False)  # Shortened description for list pages
+    isbn = db.Column(db.String(13), nullable=True)  # Canonical ISBN-13, see isbn.py
+    category_id = db.Column(db.Integer, db.ForeignKey('category.id'), nullable=False)
+    category = db.relationship('Category', lazy='joined')
+    image = db.Column(db.String(500), nullable=False)
+    publisher = db.Column(db.String(100), nullable=False)
+    published_on = db.Column(db.DateTime, nullable=False)
+    rating = db.Column(db.Float, nullable=True)
+    reviews = db.Column(db.Integer, nullable=True)
+    # Bumped by every ORM update; drives ETag/Last-Modified of the product page
+    updated_at = db.Column(db.DateTime, nullable=False, default=utcnow, onupdate=utcnow)
+
+    # Composite indexes backing keyset pagination of category listings
+    __table_args__ = (
+        db.Index('ix_product_category_id', 'category_id', 'id'),
+        db.Index('ix_product_category_published_on', 'category_id', 'published_on', 'id'),
+        db.Index('ix_product_category_rating', 'category_id', 'rating', 'id'),
+        db.Index('ix_product_isbn', 'isbn', unique=True),
+        db.Index('ix_product_author', 'author'),
+    )
+
+    @validates('description')
+    def update_summary(self, key, description):
+        self.summary = summarize(description)
+        return description
+
+    @validates('isbn')
+    def validate_isbn(self, key, isbn):
+        # Raises ValueError for a malformed ISBN or a wrong check digit
+        return None if isbn is None else normalize_isbn(isbn)
+
+install_count_triggers(Product, Category)
+install_version_triggers(Product)
+install_index(Product)
+
+# Read models over the catalog, built for each app by init_app
+catalog = LocalProxy(lambda: current_app.extensions['catalog'])
+search_index = LocalProxy(lambda: current_app.extensions['search_index'])
+suggest_index = LocalProxy(lambda: current_app.extensions['suggest_index'])
+
+# Registered once; commits run in an app context, so each reaches its own app's caches
+on_commit_of(db.session, (Product, Category), lambda changes: catalog.invalidate())
+on_commit_of(db.session, (Product,), lambda changes: suggest_index.apply(changes), suggest.snapshot)
+page_cache.invalidate_on(db.session, Product, Category)
 
 class Order(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    product_id = db.Column(db.Integer, db.ForeignKey('product.id'), nullable=False)  # Corrected foreign key reference
+    product_id = db.Column(db.Integer, db.ForeignKey('product.id'), nullable=False)
     quantity = db.Column(db.Integer, nullable=False)
+    checkout_key = db.Column(db.String(64), nullable=False)
     customer_name = db.Column(db.String(100), nullable=False)
-    customer_address = db.Column(db.Text, nullable=False)
+    customer_address = db.Column(db.String(500), nullable=False)
     customer_email = db.Column(db.String(100), nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False, default=utcnow)
+
+    # The checkout key makes order creation idempotent: a resubmitted
+    # checkout cannot record the same product twice
+    __table_args__ = (
+        db.UniqueConstraint('checkout_key', 'product_id', name='uq_order_checkout_product'),
+        db.Index('ix_order_product_id', 'product_id'),
+    )
 
 class Cart(db.Model):
     id = db.Column(db.Integer, primary_key=True)
+    token = db.Column(db.String(64), nullable=False)
     product_id = db.Column(db.Integer, db.ForeignKey('product.id'), nullable=False)
     quantity = db.Column(db.Integer, nullable=False)
+    product = db.relationship('Product', backref='carts')
+
+    # One line per product in each cart; also serves lookups by token
+    __table_args__ = (
+        db.UniqueConstraint('token', 'product_id', name='uq_cart_token_product'),
+        db.Index('ix_cart_product_id', 'product_id'),
+    )
+
 
+def init_app(app):
+    """Build the app's catalog read models and cart store."""
+    app.extensions['catalog'] = CatalogView(db, Product, Category)
+    app.extensions['search_index'] = SearchIndex(db, Product)
+    app.extensions['suggest_index'] = suggest.SuggestIndex()
+    app.extensions['cart_store'] = create_cart_store(app.config, db, Product, Cart, Order)
@@ -0,0 +1,30 @@
+# money.py
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+# Prices are stored as integer minor units (cents) plus an ISO 4217 code
+DEFAULT_CURRENCY = 'USD'
+CURRENCY_SYMBOLS = {'USD': '$', 'EUR': '€', 'GBP': '£'}
+
+
+def to_cents(value):
+    """Convert a decimal amount such as ``'18.90'`` or ``18.9`` to integer cents.
+
+    Raises ValueError for anything that is not a number.
+    """
+    try:
+        amount = Decimal(str(value).strip())
+    except InvalidOperation as exc:
+        raise ValueError(f'invalid amount: {value!r}') from exc
+    if not amount.is_finite():
+        raise ValueError(f'invalid amount: {value!r}')
+    return int(amount.scaleb(2).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def format_money(cents, currency=DEFAULT_CURRENCY):
+    """Format cents for display, e.g. ``1890`` -> ``'$18.90'``."""
+    sign = '-' if cents < 0 else ''
+    units, cents = divmod(abs(cents), 100)
+    symbol = CURRENCY_SYMBOLS.get(currency)
+    if symbol is None:
+        return f'{sign}{units:,}.{cents:02d} {currency}'
+    return f'{sign}{symbol}{units:,}.{cents:02d}'
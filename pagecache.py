@@ -0,0 +1,151 @@
+# pagecache.py
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, request, session
+
+from session_events import on_commit_of
+
+try:
+    import redis
+except ImportError:  # Optional: only needed for PAGE_CACHE_BACKEND = 'redis'
+    redis = None
+
+
+class MemoryBackend:
+    """In-process LRU with a per-entry TTL. Each worker has its own copy."""
+
+    def __init__(self, max_entries=1024, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries = OrderedDict()  # key -> (expires, value)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= self.clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (self.clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisBackend:
+    """Cache shared by all workers, so an invalidation is seen everywhere.
+
+    Keys are prefixed with a generation number; clear() bumps the generation
+    instead of deleting keys, and the old entries expire through their TTL.
+    """
+
+    def __init__(self, client, prefix='pagecache:'):
+        self.client = client
+        self.prefix = prefix
+
+    def _key(self, key):
+        generation = self.client.get(self.prefix + 'generation') or b'0'
+        return f'{self.prefix}{generation.decode()}:{key}'
+
+    def get(self, key):
+        value = self.client.get(self._key(key))
+        return pickle.loads(value) if value is not None else None
+
+    def set(self, key, value, ttl):
+        self.client.set(self._key(key), pickle.dumps(value), ex=max(1, int(ttl)))
+
+    def clear(self):
+        self.client.incr(self.prefix + 'generation')
+
+
+def create_backend(config):
+    """Build the backend selected by the PAGE_CACHE_BACKEND config value."""
+    backend = config['PAGE_CACHE_BACKEND']
+    if backend == 'memory':
+        return MemoryBackend(max_entries=config['PAGE_CACHE_MAX_ENTRIES'])
+    if backend == 'redis':
+        if redis is None:
+            raise RuntimeError("PAGE_CACHE_BACKEND = 'redis' requires the redis package")
+        return RedisBackend(redis.Redis.from_url(config['PAGE_CACHE_REDIS_URL']))
+    if hasattr(backend, 'get') and hasattr(backend, 'set') and hasattr(backend, 'clear'):
+        return backend
+    raise ValueError(f'unknown PAGE_CACHE_BACKEND: {backend}')
+
+
+class PageCache:
+    """Full-response cache for pages that look the same to every anonymous visitor.
+
+    Views decorated with ``cached()`` are looked up by path and the query
+    arguments they depend on before the view runs, so a hit costs neither a
+    query nor a template render. Only requests without a session cookie are
+    served from or stored in the cache, and responses that set a cookie are
+    never stored. ``invalidate_on(db_session, *models)`` clears the cache after
+    any commit that inserted, updated or deleted one of ``models``. Each app
+    has its own backend, kept in ``app.extensions['page_cache']``.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('PAGE_CACHE_BACKEND', 'memory')  # 'memory', 'redis' or a backend object
+        app.config.setdefault('PAGE_CACHE_TTL', 300)
+        app.config.setdefault('PAGE_CACHE_MAX_ENTRIES', 1024)
+        app.config.setdefault('PAGE_CACHE_REDIS_URL', 'redis://localhost:6379/0')
+        app.extensions['page_cache'] = create_backend(app.config)
+
+    @property
+    def backend(self):
+        return current_app.extensions['page_cache']
+
+    def cacheable(self):
+        return (request.method in ('GET', 'HEAD')
+                and current_app.config['SESSION_COOKIE_NAME'] not in request.cookies)
+
+    def cached(self, query_args=()):
+        """Decorator caching a view's response, keyed on path and ``query_args``."""
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                if not self.cacheable():
+                    return view(*args, **kwargs)
+                key = request.path + '?' + '&'.join(
+                    f'{name}={request.args.get(name, "")}' for name in sorted(query_args))
+                hit = self.backend.get(key)
+                if hit is not None:
+                    status, headers, body = hit
+                    response = current_app.response_class(body, status=status, headers=headers)
+                    response.headers['X-Page-Cache'] = 'hit'
+                    return response.make_conditional(request)
+                response = current_app.make_response(view(*args, **kwargs))
+                if (response.status_code == 200 and not response.direct_passthrough
+                        and not session.modified and 'Set-Cookie' not in response.headers):
+                    self.backend.set(key, (response.status_code, list(response.headers),
+                                           response.get_data()), current_app.config['PAGE_CACHE_TTL'])
+                    response.headers['X-Page-Cache'] = 'miss'
+                return response
+            return wrapper
+        return decorator
+
+    def clear(self):
+        self.backend.clear()
+
+    def invalidate_on(self, db_session, *models):
+        """Clear the cache after commits that change rows of ``models``."""
+        on_commit_of(db_session, models, lambda changes: self.clear())
@@ -1,15 +1,223 @@
 # populate_db.py
-from paperbookcollections.models import Product
-from paperbookcollections import create_app
+"""Bulk load products from CSV or JSONL files into the catalog.
 
-# Create the Flask app
-app = create_app()
+Usage: python populate_db.py FILE [FILE ...] [--chunk-size N]
+
+Files are streamed and inserted in chunks, so memory use does not grow with
+the size of the feed. Files ending in .gz are decompressed on the fly. Each
+row needs the Product columns title, author, price (a decimal amount such as
+18.90), description, isbn, category, image, publisher and published_on
+(YYYY-MM-DD or ISO datetime); currency (default USD), rating and reviews are
+optional. ISBN-10s and hyphenated ISBNs are stored as canonical ISBN-13s.
+Categories are matched by slug and created if they do not exist yet.
+Invalid rows are reported and skipped, as are rows whose ISBN is already in
+the catalog or earlier in the feed.
+"""
+import argparse
+import csv
+import gzip
+import io
+import json
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import islice
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app import create_app
+from extensions import db, page_cache
+from models import catalog, Category, Product, search_index
+from catalog import category_slug, summarize
+from isbn import normalize_isbn
+from money import DEFAULT_CURRENCY, to_cents
+
+REQUIRED_FIELDS = ('title', 'author', 'price', 'description', 'isbn',
+                   'category', 'image', 'publisher', 'published_on')
+
+# Pragmas used while loading: no fsync, in-memory rollback journal and a
+# large page cache. A crash during the load can corrupt the database, so
+# load into a copy or have a backup.
+BULK_PRAGMAS = {
+    'synchronous': 'OFF',
+    'journal_mode': 'MEMORY',
+    'cache_size': '-262144',  # KiB, i.e. 256 MiB
+    'temp_store': 'MEMORY',
+}
+
+MAX_REPORTED_ERRORS = 20
+
+
+def open_feed(path):
+    if path.endswith('.gz'):
+        return io.TextIOWrapper(gzip.open(path), encoding='utf-8', newline='')
+    return open(path, encoding='utf-8', newline='')
+
+
+def read_rows(path):
+    """Yield (line number, row dict) pairs from a CSV or JSONL file."""
+    name = path[:-3] if path.endswith('.gz') else path
+    with open_feed(path) as feed:
+        if name.endswith('.csv'):
+            reader = csv.DictReader(feed)
+            for row in reader:
+                yield reader.line_num, row
+        elif name.endswith(('.jsonl', '.ndjson')):
+            for line_number, line in enumerate(feed, 1):
+                if line.strip():
+                    try:
+                        yield line_number, json.loads(line)
+                    except ValueError:
+                        yield line_number, None
+        else:
+            raise ValueError(f'unsupported file type: {path}')
+
+
+def parse_date(value):
+    if isinstance(value, datetime):
+        return value
+    value = str(value).strip()
+    try:
+        return datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        return datetime.fromisoformat(value)
+
+
+def optional(value, convert):
+    if value is None or str(value).strip() == '':
+        return None
+    return convert(value)
+
+
+def validate(row):
+    """Return the row as Product column values; raises ValueError if invalid."""
+    if not isinstance(row, dict):
+        raise ValueError('not a JSON object')
+    missing = [field for field in REQUIRED_FIELDS if not str(row.get(field) or '').strip()]
+    if missing:
+        raise ValueError('missing ' + ', '.join(missing))
+    values = {field: str(row[field]).strip() for field in REQUIRED_FIELDS}
+    values['summary'] = summarize(values['description'])
+    values['isbn'] = normalize_isbn(values['isbn'])
+    values['price_cents'] = to_cents(values.pop('price'))
+    if values['price_cents'] < 0:
+        raise ValueError('negative price')
+    values['currency'] = str(row.get('currency') or DEFAULT_CURRENCY).strip().upper()
+    if len(values['currency']) != 3 or not values['currency'].isalpha():
+        raise ValueError('invalid currency')
+    values['published_on'] = parse_date(row['published_on'])
+    values['rating'] = optional(row.get('rating'), float)
+    values['reviews'] = optional(row.get('reviews'), int)
+    return values
+
+
+def valid_rows(paths, errors):
+    for path in paths:
+        for line_number, row in read_rows(path):
+            try:
+                yield validate(row)
+            except (TypeError, ValueError) as exc:
+                errors.append(f'{path}:{line_number}: {exc}')
+                if len(errors) <= MAX_REPORTED_ERRORS:
+                    print(errors[-1], file=sys.stderr)
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def assign_categories(connection, rows, category_ids):
+    """Replace each row's category name by its id, creating missing categories.
+
+    ``category_ids`` maps slugs to ids and is updated in place.
+    """
+    for row in rows:
+        name = row.pop('category')
+        slug = category_slug(name)
+        if slug not in category_ids:
+            position = connection.execute(select(func.max(Category.position))).scalar() or 0
+            category_ids[slug] = connection.execute(insert(Category.__table__).values(
+                name=name, slug=slug, position=position + 1, product_count=0,
+            )).inserted_primary_key[0]
+        row['category_id'] = category_ids[slug]
+
+
+@contextmanager
+def bulk_load_mode(connection):
+    """Apply BULK_PRAGMAS and defer secondary product indexes until the end."""
+    previous = {name: connection.exec_driver_sql(f'PRAGMA {name}').scalar()
+                for name in BULK_PRAGMAS}
+    for name, value in BULK_PRAGMAS.items():
+        connection.exec_driver_sql(f'PRAGMA {name} = {value}')
+    deferred = [index for index in Product.__table__.indexes if not index.unique]
+    for index in deferred:
+        index.drop(connection, checkfirst=True)
+    connection.commit()
+    try:
+        yield
+    finally:
+        print('Building indexes...')
+        for index in deferred:
+            index.create(connection, checkfirst=True)
+        connection.commit()
+        for name, value in previous.items():
+            connection.exec_driver_sql(f'PRAGMA {name} = {value}')
+
+
+def load(paths, chunk_size):
+    errors = []
+    loaded = duplicates = 0
+    started = time.perf_counter()
+    # The unique ISBN index stays in place during the load and rejects duplicates
+    statement = sqlite_insert(Product.__table__).on_conflict_do_nothing(index_elements=['isbn'])
+
+    # Rows are indexed for search and counted per category in one pass at
+    # the end instead of by triggers per inserted row
+    search_index.drop_triggers()
+    catalog.drop_count_triggers()
+    catalog.drop_version_triggers()
+    try:
+        with db.engine.connect() as connection:
+            category_ids = dict(connection.execute(select(Category.slug, Category.id)).all())
+            with bulk_load_mode(connection):
+                for chunk in chunked(valid_rows(paths, errors), chunk_size):
+                    with connection.begin():
+                        assign_categories(connection, chunk, category_ids)
+                        inserted = connection.execute(statement, chunk).rowcount
+                    loaded += inserted
+                    duplicates += len(chunk) - inserted
+                    elapsed = time.perf_counter() - started
+                    print(f'{loaded} rows loaded, {loaded / elapsed:.0f} rows/sec')
+    finally:
+        print('Rebuilding the search index and category counts...')
+        search_index.create()
+        catalog.create_count_triggers()
+        # Bumps the version once, so every worker reloads its suggest index
+        catalog.create_version_triggers()
+        # Core inserts bypass the session hooks; a shared page cache is cleared here
+        page_cache.clear()
+
+    elapsed = time.perf_counter() - started
+    print(f'Loaded {loaded} rows in {elapsed:.1f}s ({loaded / max(elapsed, 1e-9):.0f} rows/sec), '
+          f'skipped {len(errors)} invalid rows and {duplicates} duplicate ISBNs')
+    return loaded, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('paths', nargs='+', metavar='FILE')
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    args = parser.parse_args()
+    with create_app().app_context():
+        load(args.paths, args.chunk_size)
 
-# Populate the database with initial products
-def populate_db():
-    with app.app_context():
-        # Add your database population logic here...
-        pass
 
 if __name__ == '__main__':
-    populate_db()
+    main()
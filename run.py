@@ -1,5 +1,6 @@
 # run.py
-from paperbookcollections import create_app
+# WSGI entry point, e.g. gunicorn run:app; `flask --app app` finds create_app
+from app import create_app
 
 app = create_app()
 
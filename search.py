@@ -0,0 +1,112 @@
+# search.py
+import re
+from collections import namedtuple
+
+from sqlalchemy import DDL, event, select, text
+
+from catalog import card_columns, load_cards
+
+SearchPage = namedtuple('SearchPage', ['items', 'page', 'has_next'])
+
+# bm25() weights for the indexed columns: title, author, description, isbn
+COLUMN_WEIGHTS = (10.0, 5.0, 1.0, 10.0)
+
+FTS_TABLE = 'product_fts'
+
+_ISBN_SEPARATORS = re.compile(r'(?<=[0-9])-(?=[0-9Xx])')
+_TERMS = re.compile(r'\w+', re.UNICODE)
+
+
+def build_match_query(query):
+    """Turn free text from the search box into a safe FTS5 MATCH expression.
+
+    Hyphenated ISBNs are collapsed to match the normalized indexed form, every
+    term is quoted so FTS5 syntax in user input is treated literally, and the
+    last term is matched as a prefix. Returns None if there is nothing to match.
+    """
+    terms = _TERMS.findall(_ISBN_SEPARATORS.sub('', query))
+    if not terms:
+        return None
+    quoted = ['"%s"' % term for term in terms]
+    quoted[-1] += '*'
+    return ' '.join(quoted)
+
+
+def index_statements(table, fts_table=FTS_TABLE):
+    """SQL creating the FTS5 table over ``table`` and the triggers syncing it."""
+    row = "new.id, new.title, new.author, new.description, upper(replace(new.isbn, '-', ''))"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5("
+        f"title, author, description, isbn, "
+        f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts_table}(rowid, title, author, description, isbn) VALUES ({row}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {table} BEGIN "
+        f"DELETE FROM {fts_table} WHERE rowid = old.id; END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE OF title, author, description, isbn "
+        f"ON {table} BEGIN "
+        f"DELETE FROM {fts_table} WHERE rowid = old.id; "
+        f"INSERT INTO {fts_table}(rowid, title, author, description, isbn) VALUES ({row}); END",
+    ]
+
+
+def install_index(model, fts_table=FTS_TABLE):
+    """Create and drop the index together with the product table."""
+    table = model.__table__
+    for statement in index_statements(model.__tablename__, fts_table):
+        event.listen(table, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+    event.listen(table, 'before_drop', DDL(f'DROP TABLE IF EXISTS {fts_table}').execute_if(dialect='sqlite'))
+
+
+class SearchIndex:
+    """SQLite FTS5 index over product title, author, description and ISBN.
+
+    The index is a separate FTS5 table kept in sync with the product table by
+    triggers, so every write path (ORM, Core or raw SQL) updates it.
+    """
+
+    def __init__(self, db, model, fts_table=FTS_TABLE):
+        self.db = db
+        self.model = model
+        self.fts_table = fts_table
+        self.table = model.__tablename__
+
+    def drop_triggers(self):
+        """Stop syncing the index, e.g. for a bulk load followed by create()."""
+        for suffix in ('ai', 'ad', 'au'):
+            self.db.session.execute(text(f'DROP TRIGGER IF EXISTS {self.fts_table}_{suffix}'))
+        self.db.session.commit()
+
+    def create(self):
+        """Create the index on an existing database and fill it from scratch."""
+        for statement in index_statements(self.table, self.fts_table):
+            self.db.session.execute(text(statement))
+        self.rebuild()
+
+    def rebuild(self):
+        self.db.session.execute(text(f'DELETE FROM {self.fts_table}'))
+        self.db.session.execute(text(
+            f"INSERT INTO {self.fts_table}(rowid, title, author, description, isbn) "
+            f"SELECT id, title, author, description, "
+            f"upper(replace(isbn, '-', '')) FROM {self.table}"
+        ))
+        self.db.session.commit()
+
+    def search(self, query, page=1, per_page=20):
+        """Return a page of ProductCards matching ``query``, best BM25 rank first."""
+        match = build_match_query(query)
+        if match is None:
+            return SearchPage([], page, False)
+        weights = ', '.join(str(weight) for weight in COLUMN_WEIGHTS)
+        rows = self.db.session.execute(
+            text(f'SELECT rowid FROM {self.fts_table} WHERE {self.fts_table} MATCH :match '
+                 f'ORDER BY bm25({self.fts_table}, {weights}) LIMIT :limit OFFSET :offset'),
+            {'match': match, 'limit': per_page + 1, 'offset': (page - 1) * per_page},
+        )
+        ids = [row[0] for row in rows]
+        has_next = len(ids) > per_page
+        ids = ids[:per_page]
+
+        products = {product.id: product for product in load_cards(
+            self.db.session, select(*card_columns(self.model)).where(self.model.id.in_(ids)))}
+        return SearchPage([products[product_id] for product_id in ids if product_id in products], page, has_next)
@@ -0,0 +1,32 @@
+# session_events.py
+from sqlalchemy import event
+
+
+def on_commit_of(db_session, models, callback, snapshot=None):
+    """Call ``callback(changes)`` after each commit that inserted, updated or
+    deleted instances of ``models``.
+
+    ``changes`` holds one ``snapshot(instance, deleted)`` per changed
+    instance in flush order, taken while its attributes are still loaded, or
+    the instances themselves without a snapshot function. Changes that are
+    rolled back are discarded.
+    """
+    key = object()  # This registration's slot in session.info
+
+    @event.listens_for(db_session, 'after_flush')
+    def collect_changes(session, flush_context):
+        for changed, deleted in ((session.new, False), (session.dirty, False), (session.deleted, True)):
+            for instance in changed:
+                if isinstance(instance, models):
+                    session.info.setdefault(key, []).append(
+                        instance if snapshot is None else snapshot(instance, deleted))
+
+    @event.listens_for(db_session, 'after_commit')
+    def apply_changes(session):
+        changes = session.info.pop(key, None)
+        if changes is not None:
+            callback(changes)
+
+    @event.listens_for(db_session, 'after_rollback')
+    def discard_changes(session):
+        session.info.pop(key, None)
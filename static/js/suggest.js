@@ -0,0 +1,32 @@
+/* Navbar search suggestions, filled from /search/suggest as the user types */
+(function () {
+	var input = document.querySelector('input[data-suggest-url]');
+	if (!input) {
+		return;
+	}
+	var list = document.getElementById(input.getAttribute('list'));
+	var pending = null;
+
+	input.addEventListener('input', function () {
+		var query = input.value.trim();
+		if (pending) {
+			pending.abort();
+		}
+		if (!query) {
+			list.innerHTML = '';
+			return;
+		}
+		pending = new AbortController();
+		fetch(input.dataset.suggestUrl + '?q=' + encodeURIComponent(query), {signal: pending.signal})
+			.then(function (response) { return response.json(); })
+			.then(function (suggestions) {
+				list.innerHTML = '';
+				suggestions.forEach(function (suggestion) {
+					var option = document.createElement('option');
+					option.value = suggestion.label;
+					list.appendChild(option);
+				});
+			})
+			.catch(function () {});
+	});
+})();
@@ -0,0 +1,81 @@
+# storage.py
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+# SQLite storage profiles: pragmas run on every new connection, and engine
+# (connection pool) options. Each worker process has its own pool.
+PROFILES = {
+    # SQLite defaults: rollback journal, so a commit blocks all readers
+    'default': {
+        'pragmas': {'journal_mode': 'DELETE'},
+        'engine_options': {},
+    },
+    # WAL lets readers run alongside the single writer; synchronous=NORMAL
+    # only fsyncs at checkpoints, which is safe against corruption in WAL
+    # mode but may lose the last transactions on power loss
+    'production': {
+        'pragmas': {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'busy_timeout': '5000',  # ms a writer waits for another writer
+            'cache_size': '-65536',  # KiB, i.e. 64 MiB per connection
+            'mmap_size': '268435456',  # 256 MiB
+            'temp_store': 'MEMORY',
+        },
+        'engine_options': {
+            'pool_size': 5,
+            'max_overflow': 10,
+            'pool_timeout': 10,
+        },
+    },
+}
+
+
+def is_file_backed(uri):
+    """Whether ``uri`` names an on-disk SQLite database rather than ``:memory:``."""
+    url = make_url(uri)
+    return (url.get_backend_name() == 'sqlite' and url.database not in (None, '', ':memory:')
+            and url.query.get('mode') != 'memory')
+
+
+def set_pragmas(engine, pragmas):
+    """Run ``pragmas`` on every new DBAPI connection of ``engine``."""
+    @event.listens_for(engine, 'connect')
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
+        cursor.close()
+
+
+class StorageProfile:
+    """Apply the SQLite profile named by the SQLITE_PROFILE config value.
+
+    ``init_app`` merges the profile's pool options into
+    SQLALCHEMY_ENGINE_OPTIONS, so it must run before ``SQLAlchemy(app)``;
+    ``install(app, db)`` then hooks the pragmas onto the app's engine. Explicit
+    SQLALCHEMY_ENGINE_OPTIONS take precedence over the profile. In-memory
+    databases get a StaticPool from Flask-SQLAlchemy, which takes no pool
+    options, so those are only applied to database files.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('SQLITE_PROFILE', 'production')
+        name = app.config['SQLITE_PROFILE']
+        if name not in PROFILES:
+            raise ValueError(f'unknown SQLITE_PROFILE: {name}')
+        profile = PROFILES[name]
+        if is_file_backed(app.config['SQLALCHEMY_DATABASE_URI']):
+            app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+                **profile['engine_options'],
+                **app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}),
+            }
+        app.extensions['storage_profile'] = profile
+
+    def install(self, app, db):
+        with app.app_context():
+            set_pragmas(db.engine, app.extensions['storage_profile']['pragmas'])
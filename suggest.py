@@ -0,0 +1,254 @@
+# suggest.py
+import heapq
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import namedtuple
+
+TITLE = 'title'
+AUTHOR = 'author'
+
+Suggestion = namedtuple('Suggestion', ['label', 'kind', 'product_id'])
+
+
+def normalize(text):
+    return ' '.join(text.casefold().split())
+
+
+def snapshot(product, deleted):
+    """The (product_id, row) change ``apply`` expects for a flushed product."""
+    if deleted:
+        return product.id, None
+    return product.id, (product.title, product.author, product.reviews, product.rating)
+
+
+def _popularity(reviews, rating):
+    return (reviews or 0, rating or 0)
+
+
+def _prefix_end(prefix):
+    # The smallest string above every string that starts with ``prefix``
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class SuggestIndex:
+    """In-memory prefix index over product titles and authors.
+
+    Distinct normalized titles and authors are kept sorted and split into
+    blocks of at most ``2 * block_size`` entries, each with its own top-k
+    list. A prefix matches a contiguous run of entries: blocks inside
+    the run contribute their top-k lists and only the partial blocks at
+    either end are ranked entry by entry, so no lookup scans more than two
+    blocks plus one list per covered block. Updates patch the block holding
+    a changed entry.
+
+    ``apply`` only sees commits made through this process's session. Writes
+    from other processes or outside the ORM are noticed by comparing
+    ``version`` with the database's product write counter and reloading.
+    """
+
+    def __init__(self, k=8, block_size=256, clock=time.monotonic):
+        self.k = k
+        self.block_size = block_size
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._groups = {}         # (key, kind) -> {product_id: popularity}
+        self._labels = {}         # (key, kind) -> label as first seen
+        self._product_keys = {}   # product_id -> [(key, kind), ...]
+        self._scores = {}         # (key, kind) -> best popularity in its group
+        self._blocks = []         # sorted runs of (key, kind)
+        self._maxes = []          # last entry of each block, for bisect
+        self._tops = []           # per block [(popularity, key, kind), ...], best first
+        self._pending = []        # changes committed while loading
+        self._next_check = 0
+        self.loaded = False
+        self.loading = False
+        self.version = None       # Product write counter the last load read
+
+    def start_load(self):
+        """Claim a (re)load; False if one is already running."""
+        with self._lock:
+            if self.loading:
+                return False
+            self.loading = True
+            return True
+
+    def check_due(self, interval):
+        """True at most once per ``interval`` seconds, to poll for outside writes."""
+        now = self.clock()
+        with self._lock:
+            if now < self._next_check:
+                return False
+            self._next_check = now + interval
+            return True
+
+    def cancel_load(self):
+        with self._lock:
+            self.loading = False
+            self._pending = []
+
+    def load(self, rows, version=None):
+        """Rebuild the index from (id, title, author, reviews, rating) rows.
+
+        The new index is built without holding the lock, so lookups keep
+        being served meanwhile; changes applied during a claimed load are
+        replayed onto it. ``version`` is the product write counter read
+        before the rows.
+        """
+        index = SuggestIndex(self.k, self.block_size)
+        for product_id, title, author, reviews, rating in rows:
+            index._attach(product_id, title, author, _popularity(reviews, rating))
+        for entry, group in index._groups.items():
+            index._scores[entry] = max(group.values())
+        entries = sorted(index._groups)
+        for start in range(0, len(entries), self.block_size):
+            index._blocks.append(entries[start:start + self.block_size])
+            index._maxes.append(index._blocks[-1][-1])
+            index._tops.append(index._rank_block(index._blocks[-1]))
+        with self._lock:
+            self._groups, self._labels = index._groups, index._labels
+            self._product_keys, self._scores = index._product_keys, index._scores
+            self._blocks, self._maxes, self._tops = index._blocks, index._maxes, index._tops
+            pending, self._pending = self._pending, []
+            self.loaded, self.loading, self.version = True, False, version
+            for product_id, row in pending:
+                self._change(product_id, row)
+
+    def update(self, product_id, title, author, reviews, rating):
+        """Add a product or replace its previous title and author."""
+        with self._lock:
+            self._change(product_id, (title, author, reviews, rating))
+
+    def remove(self, product_id):
+        with self._lock:
+            self._change(product_id, None)
+
+    def suggest(self, prefix, k=None):
+        """Return up to k suggestions for ``prefix``, most popular first."""
+        k = k or self.k
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        with self._lock:
+            ranked = heapq.nlargest(k, self._candidates(prefix, k))
+            return [self._suggestion((key, kind)) for _, key, kind in ranked]
+
+    def apply(self, changes):
+        """Apply (product_id, row or None) pairs, e.g. collected by ``snapshot``, in order."""
+        for product_id, row in dict(changes).items():
+            if row is None:
+                self.remove(product_id)
+            else:
+                self.update(product_id, *row)
+
+    def _change(self, product_id, row):
+        if self.loading:
+            self._pending.append((product_id, row))
+        if not self.loaded:
+            return  # The load reads the change from the database or replays it
+        touched = self._detach(product_id)
+        if row is not None:
+            title, author, reviews, rating = row
+            touched.update(self._attach(product_id, title, author, _popularity(reviews, rating)))
+        for entry in touched:
+            self._rescore(entry)
+
+    def _suggestion(self, entry):
+        group = self._groups[entry]
+        product_id = max(group, key=group.get) if entry[1] == TITLE else None
+        return Suggestion(self._labels[entry], entry[1], product_id)
+
+    def _attach(self, product_id, title, author, popularity):
+        entries = [(normalize(title), TITLE), (normalize(author), AUTHOR)]
+        labels = {TITLE: title.strip(), AUTHOR: author.strip()}
+        for entry in entries:
+            if entry not in self._groups:
+                self._groups[entry] = {}
+                self._labels[entry] = labels[entry[1]]
+            self._groups[entry][product_id] = popularity
+        self._product_keys[product_id] = entries
+        return set(entries)
+
+    def _detach(self, product_id):
+        entries = self._product_keys.pop(product_id, [])
+        for entry in entries:
+            group = self._groups[entry]
+            group.pop(product_id, None)
+            if not group:
+                del self._groups[entry]
+                del self._labels[entry]
+        return set(entries)
+
+    def _candidates(self, prefix, k):
+        low, high = (prefix,), (_prefix_end(prefix),)
+        first = bisect_left(self._maxes, low)
+        last = min(bisect_left(self._maxes, high), len(self._blocks) - 1)
+        covered = []
+        for index in range(first, last + 1):
+            block = self._blocks[index]
+            if low <= block[0] and block[-1] < high and k <= self.k:
+                covered.append(index)
+            else:
+                start, stop = bisect_left(block, low), bisect_left(block, high)
+                for entry in block[start:stop]:
+                    yield (self._scores[entry],) + entry
+        # Only the k blocks with the best leading entries can hold any of the k best
+        for index in heapq.nlargest(k, covered, key=lambda index: self._tops[index][0]):
+            yield from self._tops[index]
+
+    def _rank_block(self, block):
+        return heapq.nlargest(self.k, ((self._scores[entry],) + entry for entry in block))
+
+    def _rescore(self, entry):
+        # Move a changed entry's score into place and patch its block's top list
+        if entry in self._groups:
+            new = entry not in self._scores
+            self._scores[entry] = max(self._groups[entry].values())
+            index = self._insert(entry) if new else bisect_left(self._maxes, entry)
+        elif entry in self._scores:
+            del self._scores[entry]
+            index = self._delete(entry)
+        else:
+            return
+        if index is None:
+            return
+        top = self._tops[index]
+        old = next((item for item in top if item[1:] == entry), None)
+        ranked = (self._scores[entry],) + entry if entry in self._scores else None
+        if old is not None and (ranked is None or ranked < old):
+            # A listed entry dropped, so one from outside the list may overtake it
+            self._tops[index] = self._rank_block(self._blocks[index])
+        elif ranked is not None:
+            if old is not None:
+                top.remove(old)
+            top.append(ranked)
+            top.sort(reverse=True)
+            del top[self.k:]
+    def _insert(self, entry):
+        if not self._blocks:
+            self._blocks.append([entry])
+            self._maxes.append(entry)
+            self._tops.append([])
+            return 0
+        index = min(bisect_left(self._maxes, entry), len(self._blocks) - 1)
+        block = self._blocks[index]
+        insort(block, entry)
+        self._maxes[index] = block[-1]
+        if len(block) > 2 * self.block_size:
+            half = len(block) // 2
+            self._blocks[index:index + 1] = [block[:half], block[half:]]
+            self._maxes[index:index + 1] = [block[half - 1], block[-1]]
+            self._tops[index:index + 1] = [self._rank_block(block[:half]),
+                                           self._rank_block(block[half:])]
+            return index if entry <= block[half - 1] else index + 1
+        return index
+
+    def _delete(self, entry):
+        index = bisect_left(self._maxes, entry)
+        block = self._blocks[index]
+        del block[bisect_left(block, entry)]
+        if block:
+            self._maxes[index] = block[-1]
+            return index
+        del self._blocks[index], self._maxes[index], self._tops[index]
+        return None
@@ -0,0 +1,36 @@
+# testing.py
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+
+@contextmanager
+def count_queries(engine):
+    """Collect the SQL statements executed on ``engine`` inside the block."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def assert_num_queries(app, db, url, expected, method='GET', client=None, **kwargs):
+    """Request ``url`` with the test client and assert how many SQL statements it issued.
+
+    Pass ``client`` to keep its session, e.g. a cart; extra keyword arguments
+    are passed to the test client. Returns the response.
+    """
+    with app.app_context():
+        engine = db.engine
+    client = client or app.test_client()
+    with count_queries(engine) as statements:
+        response = client.open(url, method=method, **kwargs)
+    if len(statements) != expected:
+        raise AssertionError('%s %s issued %d queries, expected %d:\n%s' % (
+            method, url, len(statements), expected, '\n'.join(statements)))
+    return response
@@ -0,0 +1,58 @@
+# tests/test_checkout.py
+# Run from the repository root with: python -m pytest tests
+import re
+
+import pytest
+
+from app import create_app
+from commands import add_books_to_db
+from extensions import db
+from models import Order
+
+CUSTOMER = {'name': 'Ada', 'address': '1 Main St', 'email': 'ada@example.com'}
+
+
+@pytest.fixture(params=['sql', 'memory'])
+def app(request):
+    app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://', 'CART_STORE': request.param,
+                      'WTF_CSRF_ENABLED': False})
+    with app.app_context():
+        db.create_all()
+        add_books_to_db()
+    return app
+
+
+def checkout_form(client):
+    page = client.get('/checkout').get_data(as_text=True)
+    key = re.search(r'name="idempotency_key"[^>]*value="([^"]+)"', page).group(1)
+    return dict(CUSTOMER, idempotency_key=key)
+
+
+def orders(app):
+    with app.app_context():
+        return sorted(db.session.query(Order.product_id, Order.quantity, Order.checkout_key))
+
+
+def test_resubmitted_checkout_creates_nothing(app):
+    client = app.test_client()
+    client.get('/add-to-cart/1')
+    form = checkout_form(client)
+    assert client.post('/checkout', data=form).headers['Location'] == '/checkout_success'
+    assert client.post('/checkout', data=form).headers['Location'] == '/checkout_success'
+    assert orders(app) == [(1, 1, form['idempotency_key'])]
+
+
+def test_stale_checkout_form_keeps_the_new_cart(app):
+    client = app.test_client()
+    client.get('/add-to-cart/1')
+    stale = checkout_form(client)
+    client.post('/checkout', data=stale)
+    client.get('/add-to-cart/1')
+    client.get('/add-to-cart/2')
+    assert client.post('/checkout', data=stale).headers['Location'] == '/checkout_success'
+    assert orders(app) == [(1, 1, stale['idempotency_key'])]
+
+    form = checkout_form(client)
+    client.post('/checkout', data=form)
+    assert orders(app) == sorted([(1, 1, stale['idempotency_key']),
+                                  (1, 1, form['idempotency_key']), (2, 1, form['idempotency_key'])])
@@ -0,0 +1,45 @@
+# tests/test_query_counts.py
+# Pins the number of SQL statements the cart pages issue. Run from the
+# repository root with: python -m pytest tests
+import pytest
+
+from app import create_app
+from commands import add_books_to_db
+from extensions import db
+from models import Product
+from money import format_money
+from testing import assert_num_queries
+
+
+@pytest.fixture
+def app():
+    app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://', 'CART_STORE': 'sql'})
+    with app.app_context():
+        db.create_all()
+        add_books_to_db()
+    return app
+
+
+@pytest.fixture
+def client(app):
+    client = app.test_client()
+    client.get('/add-to-cart/1')
+    client.get('/add-to-cart/2')
+    client.get('/add-to-cart/1')
+    return client
+
+
+@pytest.mark.parametrize('url', ['/basket', '/checkout'])
+def test_empty_cart_issues_no_queries(app, url):
+    assert_num_queries(app, db, url, 0)
+
+
+@pytest.mark.parametrize('url', ['/basket', '/checkout'])
+def test_cart_lines_and_totals_load_in_one_query(app, client, url):
+    response = assert_num_queries(app, db, url, 1, client=client)
+    assert response.status_code == 200
+    with app.app_context():
+        first, second = db.session.get(Product, 1), db.session.get(Product, 2)
+        assert first.currency == second.currency
+        total = format_money(2 * first.price_cents + second.price_cents, first.currency)
+    assert total in response.get_data(as_text=True)
@@ -0,0 +1,44 @@
+# tests/test_suggest.py
+# Run from the repository root with: python -m pytest tests
+import sqlite3
+import time
+
+import pytest
+
+from app import create_app
+from commands import add_books_to_db
+from extensions import db
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = tmp_path / 'books.db'
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}'})
+    with app.app_context():
+        db.create_all()
+        add_books_to_db()
+    return path
+
+
+def suggestions(client, prefix):
+    # The index is built in the background, so poll until it answers
+    for _ in range(200):
+        labels = [item['label'] for item in client.get('/search/suggest', query_string={'q': prefix}).json]
+        if labels:
+            return labels
+        time.sleep(0.01)
+    return []
+
+
+def test_suggestions_follow_writes_by_other_processes(database):
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{database}', 'SUGGEST_CHECK_INTERVAL': 0})
+    client = app.test_client()
+    assert 'The Silent Patient' in suggestions(client, 'the')
+
+    connection = sqlite3.connect(database)
+    connection.execute("UPDATE product SET title = 'Quiet Quarry' WHERE title = 'The Silent Patient'")
+    connection.commit()
+    connection.close()
+
+    client.get('/search/suggest', query_string={'q': 'qu'})  # Notices the write
+    assert suggestions(client, 'qu') == ['Quiet Quarry']
@@ -1,37 +1,233 @@
-# paperbackcollections/views.py
-from flask import render_template, redirect, url_for, request, flash
-from . import db
-from .models import Product, Order
-from .forms import CheckoutForm
-from flask import current_app as app
-
-@app.route('/')
-def index():
-    products = Product.query.all()
-    return render_template('index.html', products=products)
-
-@app.route('/product/<int:product_id>')
+# views.py
+import secrets
+import threading
+
+from flask import (abort, Blueprint, current_app, flash, jsonify, make_response, redirect,
+                   render_template, request, session, url_for)
+from sqlalchemy import select
+from werkzeug.http import is_resource_modified
+from werkzeug.local import LocalProxy
+
+from cart_store import EMPTY_BASKET, MAX_QUANTITY
+from catalog import SORT_KEYS
+from extensions import covers, db, page_cache
+from forms import AddToBasketForm, CheckoutForm
+from isbn import parse_isbn
+from models import catalog, Order, Product, search_index, suggest_index
+from suggest import TITLE
+
+shop = Blueprint('shop', __name__)
+
+# Built per app by create_app() from the CART_STORE config value
+cart_store = LocalProxy(lambda: current_app.extensions['cart_store'])
+
+@shop.route('/')
+@page_cache.cached()
+def home():
+    catalog_groups = catalog.grouped(limit=current_app.config['HOME_CATEGORY_LIMIT'])
+    return render_template('home.html', catalog_groups=catalog_groups)
+
+@shop.route('/category/<name>')
+def category(name):
+    category = catalog.category_for_slug(name)
+    if category is None:
+        abort(404)
+    sort = request.args.get('sort', 'id')
+    if sort not in SORT_KEYS:
+        abort(400)
+    try:
+        page = catalog.page(category, after=request.args.get('after'),
+                            limit=current_app.config['CATEGORY_PAGE_SIZE'], sort=sort)
+    except ValueError:
+        abort(400)
+    return render_template('category.html', category=category, slug=name,
+                           sort=sort, page=page)
+
+@shop.route('/search')
+def search():
+    query = request.args.get('q', '').strip()
+    page_number = request.args.get('page', 1, type=int)
+    if not 1 <= page_number <= current_app.config['SEARCH_MAX_PAGE']:
+        abort(400)
+    # An ISBN in the navbar search goes straight to its product
+    product_id = product_id_for_isbn(query)
+    if product_id is not None:
+        return redirect(url_for('.product_detail', product_id=product_id))
+    results = search_index.search(query, page=page_number,
+                                  per_page=current_app.config['SEARCH_PAGE_SIZE'])
+    return render_template('search.html', query=query, results=results)
+
+def product_id_for_isbn(value):
+    # A single probe of the unique ix_product_isbn index
+    isbn = parse_isbn(value)
+    if isbn is None:
+        return None
+    return db.session.execute(select(Product.id).where(Product.isbn == isbn)).scalar()
+
+@shop.route('/isbn/<isbn>')
+def product_by_isbn(isbn):
+    product_id = product_id_for_isbn(isbn)
+    if product_id is None:
+        abort(404)
+    return redirect(url_for('.product_detail', product_id=product_id))
+
+def load_suggest_index(app):
+    # Runs in its own thread; until the first load finishes there are no
+    # suggestions, and a reload keeps serving the previous index
+    with app.app_context():
+        try:
+            # Read before the rows: a write in between only causes another reload
+            version = catalog.version()
+            suggest_index.load(db.session.execute(
+                select(Product.id, Product.title, Product.author, Product.reviews, Product.rating)
+                .execution_options(yield_per=10000)), version)
+        except Exception:
+            current_app.logger.exception('Loading the suggest index failed')
+            suggest_index.cancel_load()
+
+def start_loading_suggest_index():
+    if suggest_index.start_load():
+        threading.Thread(target=load_suggest_index, args=(current_app._get_current_object(),),
+                         name='suggest-index', daemon=True).start()
+
+@shop.route('/search/suggest')
+def search_suggest():
+    if not suggest_index.loaded:
+        # Built in the background on first use, so neither worker start nor
+        # any request waits for it
+        start_loading_suggest_index()
+        return jsonify([])
+    # Products written by other workers or populate_db never reach this
+    # process's commit hooks, so the write counter is polled for them
+    if (suggest_index.check_due(current_app.config['SUGGEST_CHECK_INTERVAL'])
+            and catalog.version() != suggest_index.version):
+        start_loading_suggest_index()
+    suggestions = []
+    for suggestion in suggest_index.suggest(request.args.get('q', '')):
+        if suggestion.kind == TITLE:
+            url = url_for('.product_detail', product_id=suggestion.product_id)
+        else:
+            url = url_for('.search', q=suggestion.label)
+        suggestions.append({'label': suggestion.label, 'type': suggestion.kind, 'url': url})
+    return jsonify(suggestions)
+
+@shop.route('/img/cover/<int:product_id>/<int:width>')
+def product_cover(product_id, width):
+    if width not in current_app.config['COVER_WIDTHS']:
+        abort(404)
+    image_url = db.session.query(Product.image).filter_by(id=product_id).scalar()
+    if image_url is None:
+        abort(404)
+    return covers.send_cover(image_url, width)
+
+@shop.route('/product/<int:product_id>')
+@page_cache.cached()
 def product_detail(product_id):
+    # Revalidations are answered from updated_at alone, by primary key; the
+    # product and its category are only loaded to render the page
+    updated_at = db.session.execute(select(Product.updated_at).where(Product.id == product_id)).scalar()
+    if updated_at is None:
+        abort(404)
+    etag = f'product-{product_id}-{updated_at:%Y%m%d%H%M%S%f}'
+    if not is_resource_modified(request.environ, etag=etag, last_modified=updated_at):
+        return set_validators(current_app.response_class(status=304), etag, updated_at)
+    product = db.session.get(Product, product_id)
+    form = AddToBasketForm()
+    response = make_response(render_template('product_detail.html', product=product, form=form))
+    return set_validators(response, etag, updated_at)
+
+def set_validators(response, etag, last_modified):
+    # Weak: the markup may change between deploys, the product has not
+    response.set_etag(etag, weak=True)
+    response.last_modified = last_modified
+    response.cache_control.no_cache = True
+    return response
+
+@shop.route('/add-to-cart/<int:product_id>', methods=['GET', 'POST'])
+def add_to_cart(product_id):
     product = Product.query.get_or_404(product_id)
-    return render_template('product_detail.html', product=product)
+    quantity = 1
+    if request.method == 'POST':
+        form = AddToBasketForm()
+        if not form.validate_on_submit():
+            return render_template('product_detail.html', product=product, form=form), 400
+        quantity = form.quantity.data
+    cart_store.add(cart_token(create=True), product_id, quantity)
+    return redirect(url_for('.basket'))
+
+# Most lines one batch request may add
+MAX_BATCH_ITEMS = 100
 
-@app.route('/cart')
-def cart():
-    orders = Order.query.all()
-    return render_template('cart.html', orders=orders)
+@shop.route('/add-to-cart/batch', methods=['POST'])
+def add_to_cart_batch():
+    # Expects JSON: {"items": [{"product_id": 1, "quantity": 2}, ...]}, each
+    # quantity within the add-to-basket form's range
+    payload = request.get_json(silent=True) or {}
+    try:
+        items = [(int(item['product_id']), int(item.get('quantity', 1)))
+                 for item in payload['items']]
+    except (KeyError, TypeError, ValueError):
+        abort(400)
+    if not items or len(items) > MAX_BATCH_ITEMS:
+        abort(400)
+    # Ids past SQLite's 64-bit integers could not even be bound
+    if any(not 1 <= quantity <= MAX_QUANTITY or not 0 < product_id < 2 ** 63
+           for product_id, quantity in items):
+        abort(400)
+    product_ids = {product_id for product_id, _ in items}
+    if Product.query.filter(Product.id.in_(product_ids)).count() != len(product_ids):
+        abort(404)
+    cart_store.add_many(cart_token(create=True), items)
+    return jsonify({'added': len(items)})
 
-@app.route('/checkout', methods=['GET', 'POST'])
+# remove cart item
+@shop.route('/remove-from-cart/<int:cart_id>')
+def remove_from_cart(cart_id):
+    token = cart_token()
+    if token is None or not cart_store.remove(token, cart_id):
+        abort(404)
+    return redirect(url_for('.basket'))
+
+def cart_token(create=False):
+    # Each visitor's cart is keyed by a random token kept in their session
+    token = session.get('cart_token')
+    if token is None and create:
+        token = session['cart_token'] = secrets.token_urlsafe(32)
+    return token
+
+def cart_basket():
+    token = cart_token()
+    return cart_store.basket(token) if token else EMPTY_BASKET
+
+@shop.route('/basket', methods=['GET', 'POST'])
+def basket():
+    basket = cart_basket()
+    return render_template('basket.html', carts=basket.lines, totals=basket.totals)
+
+@shop.route('/checkout', methods=['GET', 'POST'])
 def checkout():
     form = CheckoutForm()
     if form.validate_on_submit():
-        order = Order(
-            customer_name=form.name.data,
-            customer_address=form.address.data,
-            customer_email=form.email.data,
-            # Add more logic here to associate products with the order
-        )
-        db.session.add(order)
-        db.session.commit()
-        flash('Order placed successfully!', 'success')
-        return redirect(url_for('index'))
-    return render_template('checkout.html', form=form)
+        token = cart_token()
+        checkout_key = form.idempotency_key.data
+        customer = {
+            'customer_name': form.name.data,
+            'customer_address': form.address.data,
+            'customer_email': form.email.data,
+        }
+        created = cart_store.checkout(token, checkout_key, customer) if token else 0
+        # Nothing is created for a resubmitted or stale form whose checkout
+        # already completed; the cart is left as it is
+        if not created and db.session.query(Order.id).filter_by(checkout_key=checkout_key).first() is None:
+            flash('Your cart is empty.', 'warning')
+            return redirect(url_for('.basket'))
+        flash('Checkout successful!', 'success')
+        return redirect(url_for('.checkout_success'))
+    if not form.idempotency_key.data:
+        form.idempotency_key.data = secrets.token_urlsafe(32)
+    basket = cart_basket()
+    return render_template('checkout.html', carts=basket.lines, totals=basket.totals, form=form)
+
+@shop.route('/checkout_success')
+def checkout_success():
+    return render_template('checkout_success.html')